@@ -1,334 +1,3045 @@
+import time
+_IMPORT_START = time.perf_counter()  # Start of the "imports" phase for --profile-startup
+import json
+import os
+import socket
+import sys
+
+# === Single-Instance Client ===
+# Defined before the GUI imports so that "ToolLauncher.py --show" and friends
+# can hand their command to a running instance without loading Tk.
+INSTANCE_FILE = "ToolLauncher.instance"  # Port and token of the running instance
+INSTANCE_COMMANDS = {"--launch": "launch", "--show": "show", "--reload": "reload"}
+INVALID_TOKEN_ERROR = "Invalid instance token"
+
+def get_app_dir():
+    """Get the ToolLauncher folder in AppData."""
+    # Use APPDATA environment variable for more reliable path resolution
+    appdata = os.getenv("APPDATA")
+    if not appdata:
+        # Fallback to expanduser if APPDATA is not set
+        appdata = os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
+    return os.path.join(appdata, "ToolLauncher")
+
+def parse_instance_command(argv):
+    """Return (command, argument) for --launch NAME, --show or --reload, else None.
+
+    A plain start with no arguments counts as --show, so starting the
+    launcher twice just brings up the running instance's popup.
+    """
+    if not argv:
+        return ("show", "")
+    for flag, command in INSTANCE_COMMANDS.items():
+        if flag in argv:
+            index = argv.index(flag)
+            if command == "launch":
+                if index + 1 >= len(argv):
+                    return None
+                return (command, argv[index + 1])
+            return (command, "")
+    return None
+
+def send_instance_command(command, argument="", timeout=0.5):
+    """Send a command to the running instance.
+
+    Returns the instance's reply ({'ok': bool, 'error': str}), or None when
+    no instance is listening. A listener that rejects our token is not ours
+    (e.g. a stale instance file whose port another user's instance now
+    holds), so that also counts as no instance.
+    """
+    try:
+        with open(os.path.join(get_app_dir(), INSTANCE_FILE), encoding='utf-8') as f:
+            info = json.load(f)
+        with socket.create_connection(("127.0.0.1", int(info['port'])), timeout=timeout) as conn:
+            conn.settimeout(5.0)  # The instance may be busy for a moment
+            request = {'token': info['token'], 'command': command, 'argument': argument}
+            conn.sendall(json.dumps(request).encode('utf-8') + b"\n")
+            reply = json.loads(conn.makefile('rb').readline())
+        if not isinstance(reply, dict) or reply.get('error') == INVALID_TOKEN_ERROR:
+            return None
+        return reply
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+if __name__ == "__main__":
+    _COMMAND = parse_instance_command(sys.argv[1:])
+    _REPLY = send_instance_command(*_COMMAND) if _COMMAND else None
+    if _REPLY is not None:
+        if not _REPLY.get('ok'):
+            print(_REPLY.get('error', "Command failed"), file=sys.stderr)
+        sys.exit(0 if _REPLY.get('ok') else 1)
+
 import tkinter as tk
+from tkinter import filedialog, messagebox
+import tkinter.font as tkfont
+import base64
+import bisect
 import configparser
-import webbrowser
+import csv
+import gc
+import hashlib
+import hmac
+import io
+import itertools
+import locale
+import marshal
+import math
+import secrets
+import shlex
+import shutil
 import threading
 import subprocess
-import time
-import pystray
-from pystray import MenuItem as item
-from PIL import Image
+import tempfile
+import urllib.parse
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from html.parser import HTMLParser
 import keyboard
-import os
-import sys
-import winreg
+# pystray, PIL, webbrowser, winreg and http.client are imported where they are
+# used so that the hotkey can be registered before they are loaded
+
+DEFAULT_HOTKEY = "ctrl+alt+f"  # Default hotkey if not specified in config
+DEFAULT_VIRTUALIZE_THRESHOLD = 300  # Tool count above which the popup draws tiles on a canvas
+CONFIG_FILE = "ToolLauncher.conf"
+CONFIG_DIR = "ToolLauncher.d"  # Directory of .conf fragments next to the main config
+SNAPSHOT_FILE = "ToolLauncher.snapshot"  # Compiled catalog, rebuilt whenever a source changes
+SNAPSHOT_FORMAT = 5
+WORKSPACE_PREFIX = "Workspace:"  # Sections named [Workspace:<name>] define workspaces
+ICON_FILE = "ToolLauncher_Logo.ico"
+CURRENT_POPUP = None  # Track the current popup window
+CURRENT_HOTKEY = DEFAULT_HOTKEY  # Will be updated from config if specified
+
+# === Check if Windows is in Dark Mode ===
+def is_dark_mode():
+    try:
+        import winreg
+        registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
+        key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
+        value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
+        return value == 0
+    except:
+        return False  # Default to light mode if detection fails
+
+# === Theme Palette ===
+THEMES = {
+    'dark': {
+        'bg': "#1e1e1e",
+        'fg': "#ffffff",
+        'subtext': "#aaaaaa",
+        'hover_bg': "#2d2d2d",
+        'border': "#404040",
+        'underline': "#404040",
+        'entry_bg': "#2d2d2d",
+        'entry_fg': "#ffffff",
+        'hint': "#999999",
+        'primary_bg': "#0e639c",
+        'primary_active': "#1177bb",
+        'secondary_bg': "#3e3e42",
+        'secondary_active': "#555555",
+        'status_up': "#3fb950",
+        'status_down': "#f85149",
+        'status_error': "#d29922",
+    },
+    'light': {
+        'bg': "#f0f0f0",
+        'fg': "#000000",
+        'subtext': "gray",
+        'hover_bg': "#e8e8e8",
+        'border': "#dddddd",
+        'underline': "#cccccc",
+        'entry_bg': "#ffffff",
+        'entry_fg': "#000000",
+        'hint': "#666666",
+        'primary_bg': "#007acc",
+        'primary_active': "#0059b8",
+        'secondary_bg': "#e0e0e0",
+        'secondary_active': "#d0d0d0",
+        'status_up': "#1a7f37",
+        'status_down': "#cf222e",
+        'status_error': "#9a6700",
+    },
+}
+
+def get_palette(dark):
+    """Return the precomputed colour palette for the light or dark theme."""
+    return THEMES['dark' if dark else 'light']
+
+TILE_BINDTAG = "LauncherTile"  # Shared bindtag for every widget inside a tool tile
+
+# === Resource Path Resolver ===
+def resource_path(filename):
+    if hasattr(sys, '_MEIPASS'):
+        return os.path.join(sys._MEIPASS, filename)
+    return os.path.join(os.path.abspath(os.path.dirname(__file__)), filename)
+
+# === Latency Tracing ===
+class LatencyTracer:
+    """Bounded ring buffer of timed spans on the hotkey-to-launch path.
+
+    Span names in use: hotkey_dispatch (hotkey/tray callback until the Tk
+    loop runs show_popup), event_queue (any dispatcher event from post()
+    until its handler runs), config_load, widget_build, hotkey_to_map (callback
+    until the popup's <Map> event), launch_tool (click handler work) and
+    launch_spawn (submit until the process or browser was started) and
+    workspace_run (a whole workspace, until every step started or failed).
+    """
+
+    def __init__(self, capacity=2000):
+        self.spans = deque(maxlen=capacity)  # (name, seconds, wall-clock time)
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.spans.append((name, seconds, time.time()))
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def summary(self):
+        """Return {name: {count, p50_ms, p95_ms, p99_ms, max_ms}}."""
+        with self._lock:
+            spans = list(self.spans)
+        samples = {}
+        for name, seconds, _ in spans:
+            samples.setdefault(name, []).append(seconds * 1000)
+        result = {}
+        for name, values in samples.items():
+            values.sort()
+
+            def pct(p):
+                # Nearest-rank percentile
+                return values[min(len(values) - 1, max(0, math.ceil(p * len(values) / 100) - 1))]
+
+            result[name] = {'count': len(values), 'p50_ms': pct(50), 'p95_ms': pct(95),
+                            'p99_ms': pct(99), 'max_ms': values[-1]}
+        return result
+
+    def export(self):
+        """Return a JSON-serialisable snapshot of the aggregates and raw spans."""
+        with self._lock:
+            spans = list(self.spans)
+        return {'generated': time.strftime("%Y-%m-%dT%H:%M:%S"),
+                'platform': sys.platform,
+                'summary': self.summary(),
+                'catalog': CATALOG.stats(),
+                'dispatcher': DISPATCHER.stats(),
+                'health': HEALTH.stats(),
+                'targets': RESOLVER.stats(),
+                'icons': ICONS.stats(),
+                'memory': memory_report(),
+                'spans': [{'name': name, 'ms': seconds * 1000, 'at': at} for name, seconds, at in spans]}
+
+TRACER = LatencyTracer()
+
+# === Event Dispatcher ===
+class EventDispatcher:
+    """Queue that carries work from background threads to the Tk loop.
+
+    The hotkey, tray, IPC and launch/workspace worker threads never touch
+    Tk; they post() an event type plus a handler and the Tk loop drains the
+    queue every poll_ms. A coalesced event is dropped while another of the
+    same type is still queued, so mashing the hotkey costs one toggle.
+    Events posted before start() wait in the queue until Tk is up.
+    """
+
+    def __init__(self, poll_ms=20, batch=100):
+        self.poll_ms = poll_ms
+        self.batch = batch  # Max events handled per tick, so a flood can't stall the UI
+        self._queue = deque()  # (kind, handler, args, coalesce, posted perf_counter)
+        self._pending = set()  # Coalesced kinds currently queued
+        self._lock = threading.Lock()
+        self._root = None
+        self.posted = 0
+        self.coalesced = 0
+        self.handled = 0
+
+    def post(self, kind, handler, *args, coalesce=False):
+        """Queue handler(*args) for the Tk thread; returns False if coalesced away."""
+        with self._lock:
+            if coalesce:
+                if kind in self._pending:
+                    self.coalesced += 1
+                    return False
+                self._pending.add(kind)
+            self._queue.append((kind, handler, args, coalesce, time.perf_counter()))
+            self.posted += 1
+        return True
+
+    def start(self, tk_root):
+        """Begin draining on the Tk thread."""
+        self._root = tk_root
+        self._poll()
+
+    def _poll(self):
+        self.drain()
+        self._root.after(self.poll_ms, self._poll)
+
+    def drain(self):
+        """Run up to batch queued handlers (Tk thread only)."""
+        for _ in range(self.batch):
+            with self._lock:
+                if not self._queue:
+                    return
+                kind, handler, args, coalesce, posted_at = self._queue.popleft()
+                if coalesce:
+                    self._pending.discard(kind)
+            TRACER.record("event_queue", time.perf_counter() - posted_at)
+            self.handled += 1
+            try:
+                handler(*args)
+            except Exception as e:
+                print(f"Error handling {kind} event: {e}")
+
+    def stats(self):
+        with self._lock:
+            queued = len(self._queue)
+        return {'posted': self.posted, 'coalesced': self.coalesced,
+                'handled': self.handled, 'queued': queued}
+
+DISPATCHER = EventDispatcher()
+
+# === Launch Engine ===
+class LaunchRecord:
+    """Status of a single launch as it moves through the engine."""
+
+    def __init__(self, target):
+        self.target = target
+        self.status = "pending"  # pending -> started -> exited, or failed
+        self.error = None
+        self.exit_code = None
+        self.submitted = time.perf_counter()
+        self.spawn_latency = None  # Seconds from submit until the process/browser was started
+        self.console = False  # Run as a command with its output streamed to a console
+        self.resolved = None  # (argv, direct, error) from RESOLVER for path/command targets
+        self.command = None  # For path/command targets: True if from command =, else False
+        self.settled = threading.Event()  # Set once the launch has started or failed
+
+    def __repr__(self):
+        return f"<LaunchRecord {self.target!r} {self.status}>"
+
+class LaunchEngine:
+    """Runs launches on a bounded worker pool so the Tk thread never waits.
+
+    Processes are started with argument lists (no shell), using the argv
+    RESOLVER worked out for path/command targets. The pool only spawns: a
+    single watcher thread polls started processes for up to exit_timeout
+    seconds to collect the exit code of short-lived openers such as
+    xdg-open. Failures are handed back to the Tk thread via DISPATCHER.
+    Console commands are piped into a CommandRun and shown in a ConsoleWindow.
+    """
+
+    def __init__(self, max_workers=4, exit_timeout=2.0, history=100, poll_interval=0.05):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="launch")
+        self.exit_timeout = exit_timeout
+        self.poll_interval = poll_interval
+        self.records = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self._watched = []  # (proc, record, deadline) awaiting an exit code
+        self._watcher = None
+        self.on_failure = None  # Called on the Tk thread with the failed LaunchRecord
+
+    def submit(self, target, console=False, resolved=None, command=None):
+        """Queue a launch. Path/command targets pass command (True/False) and,
+        if RESOLVER had it cached, resolved; otherwise they are resolved on
+        the pool, since a network path can take seconds to check."""
+        record = LaunchRecord(target)
+        record.console = console
+        record.resolved = resolved
+        record.command = command
+        with self._lock:
+            self.records.append(record)
+        self.executor.submit(self._run, record)
+        return record
+
+    def recent(self):
+        with self._lock:
+            return list(self.records)
+
+    def _run(self, record):
+        target = record.target
+        try:
+            if record.resolved is None and record.command is not None:
+                record.resolved = RESOLVER.lookup(target, record.command)
+            argv, direct, error = record.resolved or ([target], False, None)
+            if error:
+                raise OSError(error)
+            if record.console:
+                proc = subprocess.Popen(argv if record.resolved else command_argv(target),
+                                        stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.PIPE,
+                                        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+                self._started(record)
+                DISPATCHER.post("console", ConsoleWindow, CommandRun(record, proc))
+                return
+            if is_url(target):
+                import webbrowser
+                if not webbrowser.open(target):
+                    raise OSError("no web browser available")
+                self._started(record)
+                return
+            if sys.platform == 'win32':
+                if len(argv) > 1:
+                    os.startfile(argv[0], arguments=subprocess.list2cmdline(argv[1:]))
+                else:
+                    os.startfile(argv[0])
+                self._started(record)
+                return
+            proc = subprocess.Popen(argv if direct else opener_command(argv[0]),
+                                    stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL,
+                                    start_new_session=True)
+            self._started(record)
+            self._watch(proc, record)
+        except Exception as e:
+            self._failed(record, e)
+
+    def _failed(self, record, error):
+        record.status = "failed"
+        record.error = str(error)
+        record.settled.set()
+        print(f"Error launching {record.target}: {error}")
+        if self.on_failure is not None:
+            DISPATCHER.post("launch_failed", self.on_failure, record)
+
+    def _watch(self, proc, record):
+        with self._lock:
+            self._watched.append((proc, record, time.monotonic() + self.exit_timeout))
+            if self._watcher is None:
+                self._watcher = threading.Thread(target=self._reap, daemon=True, name="launch-watch")
+                self._watcher.start()
+
+    def _reap(self):
+        """Collect exit codes until no process is watched any more."""
+        while True:
+            time.sleep(self.poll_interval)
+            with self._lock:
+                watched, self._watched = self._watched, []
+            waiting = []
+            now = time.monotonic()
+            for proc, record, deadline in watched:
+                code = proc.poll()
+                if code is None:
+                    if now < deadline:
+                        waiting.append((proc, record, deadline))
+                    continue  # Past the deadline: still running, fine for a launched app
+                record.exit_code = code
+                if code != 0:
+                    self._failed(record, OSError(f"exited with code {code}"))
+                else:
+                    record.status = "exited"
+            with self._lock:
+                self._watched.extend(waiting)
+                if not self._watched:
+                    self._watcher = None
+                    return
+
+    def _started(self, record):
+        record.spawn_latency = time.perf_counter() - record.submitted
+        record.status = "started"
+        record.settled.set()
+        TRACER.record("launch_spawn", record.spawn_latency)
+
+def is_url(target):
+    return target.lower().startswith(('http://', 'https://', 'www.'))
+
+def opener_command(target):
+    """Return the argv used to open a file or program on macOS/Linux."""
+    if sys.platform == 'darwin':  # macOS
+        return ["open", target]
+    return ["xdg-open", target]
+
+def command_argv(command):
+    """Split a command line for Popen (Windows parses the string itself)."""
+    if sys.platform == 'win32':
+        return command
+    return shlex.split(command)
+
+def report_launch_failure(record):
+    """Tell the user a launch failed (runs on the Tk thread)."""
+    messagebox.showerror("ToolLauncher", f"Could not launch {record.target}:\n{record.error}")
+
+LAUNCHER = LaunchEngine()
+LAUNCHER.on_failure = report_launch_failure
+
+# === Command Console ===
+CONSOLE_MAX_LINES = 5000  # Lines kept per run, both in memory and in the window
+CONSOLE_MAX_LINE_BYTES = 8192  # Longer lines are split
+CONSOLE_REFRESH_MS = 100
+
+class CommandRun:
+    """Output and outcome of a command tool, captured off the Tk thread.
+
+    stdout and stderr are read on their own threads into one ring buffer of
+    at most max_lines lines, so a command that prints hundreds of MB only
+    ever holds the tail. A third thread waits for the exit code.
+    """
+
+    def __init__(self, record, proc, max_lines=CONSOLE_MAX_LINES):
+        self.record = record
+        self.proc = proc
+        self.lines = deque(maxlen=max_lines)  # (stream, text)
+        self.total_lines = 0
+        self.total_bytes = 0
+        self.exit_code = None
+        self.started = time.perf_counter()
+        self.duration = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+        self._encoding = locale.getpreferredencoding(False)
+        readers = [threading.Thread(target=self._read, args=(pipe, stream), daemon=True)
+                   for pipe, stream in ((proc.stdout, "stdout"), (proc.stderr, "stderr"))]
+        for reader in readers:
+            reader.start()
+        threading.Thread(target=self._wait, args=(readers,), daemon=True).start()
+
+    def _read(self, pipe, stream):
+        with pipe:
+            for raw in iter(lambda: pipe.readline(CONSOLE_MAX_LINE_BYTES), b""):
+                text = raw.decode(self._encoding, errors='replace').rstrip("\r\n")
+                with self._lock:
+                    self.lines.append((stream, text))
+                    self.total_lines += 1
+                    self.total_bytes += len(raw)
+
+    def _wait(self, readers):
+        code = self.proc.wait()
+        for reader in readers:
+            reader.join()
+        self.duration = time.perf_counter() - self.started
+        self.exit_code = self.record.exit_code = code
+        self.record.status = "exited"
+        self.done.set()
+
+    def read_since(self, seen):
+        """Return (new lines, lines dropped before they were read, new seen count).
+
+        seen is how many lines the caller has consumed so far (0 at first).
+        """
+        with self._lock:
+            new = self.total_lines - seen
+            available = min(new, len(self.lines))
+            start = len(self.lines) - available
+            lines = list(itertools.islice(self.lines, start, None)) if available else []
+            return lines, new - available, self.total_lines
+
+    def stop(self):
+        if self.proc.poll() is None:
+            self.proc.terminate()
+
+class ConsoleWindow:
+    """Log window that follows a CommandRun.
+
+    Polls the run every CONSOLE_REFRESH_MS and adds everything new with a
+    single Text insert, trimming the widget to CONSOLE_MAX_LINES lines, so
+    a chatty command costs a few inserts per second rather than one per line.
+    Closing the window leaves the command running; Stop terminates it.
+    """
+
+    def __init__(self, run):
+        self.run = run
+        self.seen = 0
+        self.poll_id = None  # Pending after() id, cancelled when the window is destroyed
+        palette = get_palette(is_dark_mode())
+        self.window = tk.Toplevel(root)
+        self.window.title(f"ToolLauncher - {run.record.target}")
+        self.window.geometry("760x420+620+300")
+        self.window.configure(bg=palette['bg'])
+
+        bar = tk.Frame(self.window, bg=palette['bg'])
+        bar.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=8)
+        self.status_label = tk.Label(bar, text="Running...", bg=palette['bg'], fg=palette['subtext'],
+                                     font=("Segoe UI", 9))
+        self.status_label.pack(side=tk.LEFT)
+        for label, command in (("Close", self.window.destroy), ("Stop", run.stop)):
+            tk.Button(bar, text=label, command=command, bg=palette['secondary_bg'],
+                      fg=palette['fg'], activebackground=palette['secondary_active'],
+                      relief=tk.FLAT, padx=12, pady=4, cursor="hand2").pack(side=tk.RIGHT, padx=(6, 0))
+
+        frame = tk.Frame(self.window, bg=palette['bg'])
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+        self.text = tk.Text(frame, bg=palette['entry_bg'], fg=palette['entry_fg'],
+                            font=("Consolas", 9), relief=tk.FLAT, wrap=tk.NONE, state=tk.DISABLED)
+        scrollbar = tk.Scrollbar(frame, command=self.text.yview)
+        self.text.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text.pack(fill=tk.BOTH, expand=True)
+        self.text.tag_configure("stderr", foreground=palette['status_down'])
+        self.text.tag_configure("info", foreground=palette['subtext'])
+        self.window.bind("<Destroy>", self._on_destroy)
+        self._poll()
+
+    def _on_destroy(self, event):
+        # <Destroy> also fires for every child widget; only the window matters
+        if event.widget is self.window and self.poll_id is not None:
+            self.window.after_cancel(self.poll_id)
+            self.poll_id = None
+
+    def _poll(self):
+        self.poll_id = None
+        lines, dropped, self.seen = self.run.read_since(self.seen)
+        if lines or dropped:
+            self._append(lines, dropped)
+        run = self.run
+        if run.done.is_set() and self.seen == run.total_lines:
+            self.status_label.configure(
+                text=f"Exited with code {run.exit_code} after {run.duration:.1f}s "
+                     f"({run.total_lines:,} lines)")
+            return
+        self.status_label.configure(
+            text=f"Running {time.perf_counter() - run.started:.0f}s ({run.total_lines:,} lines)")
+        self.poll_id = self.window.after(CONSOLE_REFRESH_MS, self._poll)
+
+    def _append(self, lines, dropped):
+        text = self.text
+        follow = text.yview()[1] >= 0.999  # Only auto-scroll if already at the bottom
+        # One insert call: alternating text and tag arguments, one pair per stream change
+        args = []
+        if dropped:
+            args += [f"... {dropped:,} lines not shown ...\n", "info"]
+        chunk = []
+        stream = None
+        for line_stream, line in lines:
+            if line_stream != stream and chunk:
+                args += ["\n".join(chunk) + "\n", stream]
+                chunk = []
+            stream = line_stream
+            chunk.append(line)
+        if chunk:
+            args += ["\n".join(chunk) + "\n", stream]
+        text.configure(state=tk.NORMAL)
+        text.insert(tk.END, *args)
+        excess = int(text.index("end-1c").split(".")[0]) - 1 - CONSOLE_MAX_LINES
+        if excess > 0:
+            text.delete("1.0", f"{excess + 1}.0")
+        text.configure(state=tk.DISABLED)
+        if follow:
+            text.see(tk.END)
+
+# === Launch Handler ===
+def launch_tool(target):
+    """Launch either a URL or an executable without blocking the caller."""
+    with TRACER.span("launch_tool"):
+        USAGE.record(target)
+        if is_url(target):
+            return LAUNCHER.submit(target)
+        # Only the cached index is read here; misses resolve on the launch pool
+        return LAUNCHER.submit(target, console=CATALOG.runs_in_console(target),
+                               resolved=RESOLVER.cached(target),
+                               command=CATALOG.is_command(target))
+
+# === Workspaces ===
+WORKSPACE_MAX_PARALLEL = 8  # Upper bound on steps waiting/launching at once per run
+
+class WorkspaceRun:
+    """Outcome of launching one workspace."""
+
+    def __init__(self, name):
+        self.name = name
+        self.records = {}   # section -> LaunchRecord
+        self.failures = {}  # section -> reason
+        self.elapsed = None  # Wall-clock seconds until every step settled
+
+def plan_workspace(steps):
+    """Order steps so that each comes after its dependencies.
+
+    Raises ValueError for dependencies outside the workspace or cycles.
+    """
+    by_name = {step[0]: step for step in steps}
+    for section, after, _ in steps:
+        missing = [dep for dep in after if dep not in by_name]
+        if missing:
+            raise ValueError(f"{section} depends on {', '.join(missing)}, which is not in the workspace")
+
+    ordered = []
+    placed = set()
+    pending = list(steps)
+    while pending:
+        ready = [step for step in pending if all(dep in placed for dep in step[1])]
+        if not ready:
+            raise ValueError("circular dependency between " + ", ".join(step[0] for step in pending))
+        for step in ready:
+            ordered.append(step)
+            placed.add(step[0])
+        pending = [step for step in pending if step[0] not in placed]
+    return ordered
+
+def run_workspace(name):
+    """Launch every tool in a workspace in the background; returns the WorkspaceRun."""
+    workspace = CATALOG.workspaces().get(name)
+    if workspace is None:
+        print(f"Unknown workspace: {name}")
+        return None
+    run = WorkspaceRun(name)
+    threading.Thread(target=_execute_workspace, args=(run, workspace['steps']), daemon=True).start()
+    return run
+
+def _execute_workspace(run, steps):
+    start = time.perf_counter()
+    try:
+        ordered = plan_workspace(steps)
+    except ValueError as e:
+        run.failures[run.name] = str(e)
+        ordered = []
+
+    # Independent steps start together; a step only waits for its own dependencies
+    if ordered:
+        futures = {}
+        with ThreadPoolExecutor(max_workers=min(WORKSPACE_MAX_PARALLEL, len(ordered)),
+                                thread_name_prefix="workspace") as pool:
+            for step in ordered:
+                deps = [futures[dep] for dep in step[1]]
+                futures[step[0]] = pool.submit(_run_workspace_step, run, step, deps)
+    run.elapsed = time.perf_counter() - start
+    TRACER.record("workspace_run", run.elapsed)
+    DISPATCHER.post("workspace_done", report_workspace_run, run)
+
+def _run_workspace_step(run, step, deps):
+    section, after, delay = step
+    if not all(dep.result() for dep in deps):
+        run.failures[section] = "skipped because a dependency failed"
+        return False
+    if delay:
+        time.sleep(delay)
+    target = CATALOG.target_for(section)
+    if target is None:
+        run.failures[section] = "no such tool"
+        return False
+    record = run.records[section] = launch_tool(target)
+    record.settled.wait()
+    if record.status == "failed":
+        run.failures[section] = record.error
+        return False
+    return True
+
+def report_workspace_run(run):
+    """Print the workspace timing and show any failures (runs on the Tk thread)."""
+    print(f"Workspace '{run.name}': {len(run.records)} tools launched in {run.elapsed:.2f}s")
+    if run.failures:
+        details = "\n".join(f"{section}: {reason}" for section, reason in run.failures.items())
+        messagebox.showerror("ToolLauncher", f"Workspace '{run.name}' had problems:\n{details}")
+
+# === Load Config ===
+def get_config_path():
+    """Get the full path to the config file in AppData."""
+    return os.path.join(get_app_dir(), CONFIG_FILE)
+
+def ensure_config_exists():
+    """Ensure the config file exists and create default one if not."""
+    config_path = get_config_path()
+    config_dir = os.path.dirname(config_path)
+    
+    # Create AppData directory if it doesn't exist
+    if not os.path.exists(config_dir):
+        try:
+            os.makedirs(config_dir, exist_ok=True)
+        except Exception:
+            return
+    
+    # Create default config if it doesn't exist
+    if not os.path.exists(config_path):
+        try:
+            config = configparser.ConfigParser()
+            
+            # Add Settings section with default hotkey
+            config['Settings'] = {
+                'hotkey': DEFAULT_HOTKEY
+            }
+            
+            # Add a sample tool section
+            config['Sample_Tool'] = {
+                'label': 'Open Notepad',
+                'path': 'notepad.exe',
+                'description': 'Launch Windows Notepad',
+                'category': 'Utilities'
+            }
+            
+            # Save the default config
+            with open(config_path, 'w') as f:
+                config.write(f)
+        except Exception:
+            pass
+
+# === Tool Catalog Cache ===
+PERCENT_SYNTAX = configparser.BasicInterpolation()
+
+def literal_percent(values):
+    """Escape '%' in values that aren't valid interpolation syntax.
+
+    Files written by ToolLauncher escape '%' as '%%' (see tool_section), but
+    hand-written values such as url = https://wiki/search?q=a%20b often
+    don't; those are taken literally instead of failing the whole merge.
+    """
+    result = {}
+    for key, value in values.items():
+        if value is not None and '%' in value:
+            try:
+                PERCENT_SYNTAX.before_set(None, None, key, value)
+            except ValueError:
+                value = value.replace('%', '%%')
+        result[key] = value
+    return result
+
+def conf_files(directory):
+    """Return the .conf files in directory, sorted by name (empty if missing)."""
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.lower().endswith('.conf'))
+    except OSError:
+        return []
+    return [os.path.join(directory, name) for name in names]
+
+class ToolRecord:
+    """One tool: (label, target, description, category).
+
+    Slotted to stay smaller than a tuple for large catalogs, but iterates and
+    indexes like the (label, target, description, category) tuple it
+    replaces, so `label, url, desc, category = tool` and tool[1] still work.
+    Category strings are interned since a catalog has only a handful.
+    """
+
+    __slots__ = ('label', 'target', 'description', 'category')
+
+    def __init__(self, label, target, description, category):
+        self.label = label
+        self.target = target
+        self.description = description
+        self.category = sys.intern(category)
+
+    def __iter__(self):
+        return iter((self.label, self.target, self.description, self.category))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(getattr(self, name) for name in self.__slots__[index])
+        return getattr(self, self.__slots__[index])
+
+    def __len__(self):
+        return 4
+
+    def __eq__(self, other):
+        if not isinstance(other, (ToolRecord, tuple)):
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self):
+        return hash((self.label, self.target, self.description, self.category))
+
+    def __repr__(self):
+        return f"ToolRecord{tuple(self)!r}"
+
+class ToolCatalog:
+    """Parse the config files once and serve tools/settings from memory.
+
+    The catalog is layered, lowest precedence first:
+
+      1. files/directories listed in [Settings] include = (one per line)
+      2. ToolLauncher.d/*.conf next to the main config, in filename order
+      3. the main ToolLauncher.conf
+
+    Later layers override individual keys of earlier ones. Each file is
+    cached separately and only re-parsed when its own size or mtime changes
+    (one os.stat per file per lookup), so editing the personal config does
+    not re-read a large shared catalog. invalidate() forces the main file to
+    be re-read after a save.
+
+    The parsed result is also written to a marshal snapshot next to the
+    config. A fresh process loads that instead of running configparser, as
+    long as every source file still has the recorded size and mtime (or, if
+    only the mtime moved, the same content hash).
+    """
+
+    def __init__(self, path_getter=get_config_path):
+        self._path_getter = path_getter
+        self._lock = threading.RLock()
+        self._stamp = None
+        self._settings = None  # ConfigParser holding only the merged [Settings]
+        self._layers = {}  # path -> (stamp, {section: {key: raw value}}, sha1)
+        self._main_sections = {}
+        self._tools = []
+        self._targets = {}  # section name -> target
+        self._icons = {}  # target -> icon = value, for tools that set one
+        self._commands = {}  # command = targets -> True if console = yes
+        self._workspaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.file_parses = 0  # Individual files (re)parsed
+        self.snapshot_loads = 0
+        self.version = 0  # Bumped on every (re)parse so views can skip unchanged catalogs
+
+    @staticmethod
+    def _file_stamp(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _layer(self, path):
+        """Return the raw sections of path, re-parsing only if it changed."""
+        stamp = self._file_stamp(path)
+        cached = self._layers.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        sections = {}
+        digest = None
+        if stamp is not None:
+            parser = configparser.ConfigParser(interpolation=None)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha1(data).hexdigest()
+                parser.read_string(data.decode('utf-8'), source=path)
+            except (OSError, configparser.Error, UnicodeDecodeError) as e:
+                print(f"Error reading {path}: {e}")
+            # Interned keys (and categories): every section repeats the same few
+            sections = {section: {sys.intern(key): sys.intern(value) if key == 'category' else value
+                                  for key, value in parser.items(section)}
+                        for section in parser.sections()}
+            self.file_parses += 1
+        self._layers[path] = (stamp, sections, digest)
+        return sections
+
+    def _layer_paths(self, config_path, main_sections):
+        """List the lower-precedence layer files in the order they apply."""
+        base_dir = os.path.dirname(config_path)
+        paths = []
+        includes = main_sections.get('Settings', {}).get('include', '')
+        for entry in includes.replace(';', '\n').splitlines():
+            entry = os.path.expandvars(os.path.expanduser(entry.strip()))
+            if not entry:
+                continue
+            if not os.path.isabs(entry):
+                entry = os.path.join(base_dir, entry)
+            paths.extend(conf_files(entry) if os.path.isdir(entry) else [entry])
+        paths.extend(conf_files(os.path.join(base_dir, CONFIG_DIR)))
+        return paths
+
+    def _refresh(self):
+        """Re-merge the catalog if any of its files changed since the last lookup."""
+        config_path = self._path_getter()
+        if self._settings is None:
+            self._load_snapshot(config_path)
+        main_sections = self._layer(config_path)
+        paths = self._layer_paths(config_path, main_sections) + [config_path]
+        layers = [main_sections if path == config_path else self._layer(path) for path in paths]
+        stamp = tuple((path, self._layers[path][0]) for path in paths)
+        if self._settings is not None and stamp == self._stamp:
+            self.hits += 1
+            return
+        self.misses += 1
+        if self._settings is not None:
+            self.reloads += 1
+
+        merged = {}
+        for sections in layers:
+            for section, values in sections.items():
+                merged.setdefault(section, {}).update(values)
+        config = configparser.ConfigParser()
+        for section, values in merged.items():
+            try:
+                config.read_dict({section: literal_percent(values)})
+            except (configparser.Error, ValueError) as e:
+                print(f"Error merging config section [{section}]: {e}")
+        self._settings = self._settings_parser(merged.get('Settings', {}))
+        self._main_sections = main_sections
+        self._tools, self._targets, self._icons, self._commands = self._parse_tools(config)
+        self._workspaces = self._parse_workspaces(config)
+        self._stamp = stamp
+        self.version += 1
+        self._save_snapshot(config_path, paths, merged.get('Settings', {}))
+
+    @staticmethod
+    def _settings_parser(settings):
+        config = configparser.ConfigParser()
+        try:
+            config.read_dict({'Settings': literal_percent(settings)})
+        except (configparser.Error, ValueError) as e:
+            print(f"Error reading [Settings]: {e}")
+        return config
+
+    def _load_snapshot(self, config_path):
+        """Seed the cache from the compiled snapshot if it matches the sources."""
+        path = os.path.join(os.path.dirname(config_path), SNAPSHOT_FILE)
+        try:
+            with open(path, 'rb') as f:
+                snapshot = marshal.loads(f.read())
+            if snapshot.get('format') != SNAPSHOT_FORMAT or snapshot.get('config') != config_path:
+                return False
+            layers = {}
+            for source, recorded, digest, sections in snapshot['sources']:
+                stamp = self._file_stamp(source)
+                if stamp != recorded:
+                    # A touched but unchanged file (same size and hash) is still valid
+                    if stamp is None or recorded is None or stamp[1] != recorded[1]:
+                        return False
+                    with open(source, 'rb') as f:
+                        if hashlib.sha1(f.read()).hexdigest() != digest:
+                            return False
+                layers[source] = (stamp, sections, digest)
+            paths = [source for source, _, _, _ in snapshot['sources']]
+            if config_path not in layers or \
+                    self._layer_paths(config_path, layers[config_path][1]) + [config_path] != paths:
+                return False
+            tools = [ToolRecord(*tool) for tool in snapshot['tools']]
+            targets, workspaces = snapshot['targets'], snapshot['workspaces']
+            icons, commands = snapshot['icons'], snapshot['commands']
+            settings = snapshot['settings']
+        except FileNotFoundError:
+            return False
+        except (OSError, EOFError, ValueError, TypeError, KeyError, AttributeError) as e:
+            print(f"Ignoring unreadable catalog snapshot: {e}")
+            return False
+        self._layers = layers
+        self._settings = self._settings_parser(settings)
+        self._main_sections = layers[config_path][1]
+        self._tools, self._targets, self._workspaces = tools, targets, workspaces
+        self._icons, self._commands = icons, commands
+        self._stamp = tuple((source, layers[source][0]) for source in paths)
+        self.snapshot_loads += 1
+        self.version += 1
+        return True
+
+    def _save_snapshot(self, config_path, paths, settings):
+        """Write the parsed catalog next to the config for the next cold start."""
+        if self._layers[config_path][0] is None:
+            return  # No config yet; nothing worth caching
+        snapshot = {
+            'format': SNAPSHOT_FORMAT,
+            'config': config_path,
+            'sources': [(source, self._layers[source][0], self._layers[source][2],
+                         self._layers[source][1]) for source in paths],
+            'tools': [tuple(tool) for tool in self._tools],
+            'targets': self._targets,
+            'icons': self._icons,
+            'commands': self._commands,
+            'workspaces': self._workspaces,
+            'settings': settings,
+        }
+        try:
+            write_file_atomic(os.path.join(os.path.dirname(config_path), SNAPSHOT_FILE),
+                              marshal.dumps(snapshot))
+        except (OSError, ValueError) as e:
+            print(f"Error writing catalog snapshot: {e}")
+
+    @staticmethod
+    def _parse_tools(config):
+        tools = []
+        targets = {}
+        icons = {}
+        commands = {}
+        # Skip Settings and workspace sections when processing tools
+        for section in [s for s in config.sections()
+                        if s != 'Settings' and not s.startswith(WORKSPACE_PREFIX)]:
+            try:
+                # Use section name as label, but allow override with explicit label
+                label = config.get(section, "label", fallback=section)
+
+                # Try url first, then path, then command
+                opened = (config.get(section, "url", fallback=None) or
+                          config.get(section, "path", fallback=None))
+                target = opened or config.get(section, "command", fallback=None)
+                desc = config.get(section, "description", fallback="")
+                category = config.get(section, "category", fallback="")
+                icon = config.get(section, "icon", fallback="").strip()
+            except configparser.Error as e:
+                # e.g. a %(name)s reference to a missing option: skip just this tool
+                print(f"Skipping [{section}]: {e}")
+                continue
+
+            # Only require target now, since label will always have a value
+            if target:
+                tools.append(ToolRecord(label, target, desc, category))
+                targets[section] = target
+                if icon:
+                    icons[target] = icon
+                if not opened:
+                    # console = yes streams a command's output into a log window
+                    try:
+                        commands[target] = config.getboolean(section, "console", fallback=False)
+                    except ValueError:
+                        print(f"Invalid console value for [{section}]")
+                        commands[target] = False
+        return tools, targets, icons, commands
+
+    @staticmethod
+    def _parse_workspaces(config):
+        """Parse [Workspace:<name>] sections.
+
+        The tools key lists tool section names, one per line (or comma
+        separated on a single line). Each line may add options after "|":
+
+            tools =
+                Grafana
+                Jump Host | delay=2
+                Console | after=Jump Host, Grafana
+        """
+        workspaces = {}
+        for section in config.sections():
+            if not section.startswith(WORKSPACE_PREFIX):
+                continue
+            name = section[len(WORKSPACE_PREFIX):].strip()
+            try:
+                raw = config.get(section, "tools", fallback="").strip()
+                hotkey = config.get(section, "hotkey", fallback="").strip()
+            except configparser.Error as e:
+                print(f"Skipping [{section}]: {e}")
+                continue
+            lines = raw.splitlines() if "\n" in raw else raw.split(",")
+            steps = []
+            for line in lines:
+                parts = [p.strip() for p in line.split("|")]
+                if not parts[0]:
+                    continue
+                after = ()
+                delay = 0.0
+                for option in parts[1:]:
+                    key, _, value = option.partition("=")
+                    key = key.strip().lower()
+                    if key == "after":
+                        after = tuple(v.strip() for v in value.split(",") if v.strip())
+                    elif key == "delay":
+                        try:
+                            delay = max(0.0, float(value))
+                        except ValueError:
+                            print(f"Ignoring invalid delay in [{section}]: {option}")
+                steps.append((parts[0], after, delay))
+            workspaces[name] = {'steps': steps, 'hotkey': hotkey}
+        return workspaces
+
+    def tools(self):
+        """Return the parsed ToolRecord list (unpacks as label, target, description, category)."""
+        with self._lock:
+            self._refresh()
+            return list(self._tools)
+
+    def versioned_tools(self):
+        """Return (tools, version) read together, so the version matches the list."""
+        with self._lock:
+            self._refresh()
+            return list(self._tools), self.version
+
+    def target_for(self, section):
+        """Return the target of the tool defined in section, or None."""
+        with self._lock:
+            self._refresh()
+            return self._targets.get(section)
+
+    def runs_in_console(self, target):
+        """Return True if target is a command tool whose output goes to a console."""
+        with self._lock:
+            self._refresh()
+            return self._commands.get(target, False)
+
+    def is_command(self, target):
+        """Return True if target came from a command = key."""
+        with self._lock:
+            self._refresh()
+            return target in self._commands
+
+    def local_targets(self):
+        """Return [(target, is_command)] for every tool that isn't a URL."""
+        with self._lock:
+            self._refresh()
+            return [(tool.target, tool.target in self._commands)
+                    for tool in self._tools if not is_url(tool.target)]
+
+    def icon_for(self, target):
+        """Return the icon = value of the tool with this target, or None."""
+        with self._lock:
+            self._refresh()
+            return self._icons.get(target)
+
+    def workspaces(self):
+        """Return {name: {'steps': [(section, after, delay)], 'hotkey': str}}."""
+        with self._lock:
+            self._refresh()
+            return dict(self._workspaces)
+
+    def get_setting(self, key, fallback=None):
+        """Return a value from the [Settings] section."""
+        with self._lock:
+            self._refresh()
+            return self._settings.get('Settings', key, fallback=fallback)
+
+    def copy_config(self):
+        """Return an editable copy of the main config file (for the settings dialog).
+
+        Included layers are left out so saving never copies shared entries
+        into the personal config.
+        """
+        with self._lock:
+            self._refresh()
+            # No interpolation: values round-trip exactly as written, '%%'
+            # escapes and stray '%' alike; tool_section() escapes new ones
+            config = configparser.ConfigParser(interpolation=None)
+            config.read_dict(self._main_sections)
+            return config
+
+    def taken_names(self):
+        """Return (section names, tool targets) across every layer, shared ones included.
+
+        New tools must avoid both: a section name that exists in an included
+        layer would merge key by key into that shared entry.
+        """
+        with self._lock:
+            self._refresh()
+            names = set()
+            for path, _ in self._stamp:
+                names.update(self._layers[path][1])
+            return names, {tool.target for tool in self._tools}
+
+    def invalidate(self):
+        """Force the next lookup to re-parse the main config file."""
+        with self._lock:
+            self._stamp = None
+            self._layers.pop(self._path_getter(), None)
+
+    def reload(self):
+        """Force the next lookup to re-parse every layer."""
+        with self._lock:
+            self._stamp = None
+            self._layers.clear()
+
+    def stats(self):
+        """Return cache hit/miss/reload counters."""
+        return {'hits': self.hits, 'misses': self.misses, 'reloads': self.reloads,
+                'file_parses': self.file_parses, 'snapshot_loads': self.snapshot_loads}
+
+CATALOG = ToolCatalog()
+
+def load_tools():
+    return CATALOG.tools()
+
+# === Usage Log & Frecency ===
+USAGE_LOG_FILE = "ToolLauncher_usage.log"
+USAGE_SCORES_FILE = "ToolLauncher_usage.json"
+FRECENCY_HALF_LIFE = 14 * 24 * 3600  # A launch counts half as much after two weeks
+USAGE_COMPACT_EVERY = 500  # Fold the log into the score file after this many launches
+USAGE_MIN_SCORE = 0.01  # Scores that decay below this are dropped at compaction
+
+class UsageTracker:
+    """Frecency scores backed by an append-only launch log.
+
+    Each launch appends one JSON line ([time, target]) to the log. The log is
+    periodically compacted into a small score file holding each target's
+    exponentially decayed score at a reference time, then truncated, so both
+    files stay bounded however long the history is.
+    """
+
+    def __init__(self, directory_getter=lambda: os.path.dirname(get_config_path())):
+        self._directory_getter = directory_getter
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._reference = time.time()
+        self._scores = {}  # target -> decayed score at self._reference
+        self._log_lines = 0
+        self._log_needs_newline = False  # Log ends in a partial line from an interrupted write
+        self.version = 0  # Bumped on every launch so views can re-rank
+
+    def _paths(self):
+        directory = self._directory_getter()
+        return (os.path.join(directory, USAGE_LOG_FILE),
+                os.path.join(directory, USAGE_SCORES_FILE))
+
+    def _decay(self, seconds):
+        return 0.5 ** (seconds / FRECENCY_HALF_LIFE)
+
+    def _add(self, target, when):
+        self._scores[target] = self._scores.get(target, 0.0) + self._decay(self._reference - when)
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        log_path, scores_path = self._paths()
+        try:
+            with open(scores_path) as f:
+                data = json.load(f)
+            self._reference = float(data['reference'])
+            self._scores = {str(k): float(v) for k, v in data['scores'].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        # Move the reference to now so fresh launches need no decay
+        now = time.time()
+        factor = self._decay(now - self._reference)
+        self._scores = {k: v * factor for k, v in self._scores.items()}
+        self._reference = now
+        try:
+            with open(log_path, encoding='utf-8') as f:
+                line = ""
+                for line in f:
+                    try:
+                        when, target = json.loads(line)
+                        self._add(str(target), float(when))
+                    except (ValueError, TypeError):
+                        continue  # Partial line from an interrupted write
+                    self._log_lines += 1
+                self._log_needs_newline = bool(line) and not line.endswith("\n")
+        except OSError:
+            pass
+
+    def record(self, target):
+        """Append one launch to the log."""
+        now = time.time()
+        with self._lock:
+            self._load()
+            log_path, _ = self._paths()
+            try:
+                with open(log_path, 'a', encoding='utf-8') as f:
+                    prefix = "\n" if self._log_needs_newline else ""
+                    f.write(prefix + json.dumps([round(now), target]) + "\n")
+                self._log_needs_newline = False
+            except OSError as e:
+                print(f"Error writing usage log: {e}")
+            self._add(target, now)
+            self._log_lines += 1
+            self.version += 1
+            compact = self._log_lines >= USAGE_COMPACT_EVERY
+        if compact:
+            threading.Thread(target=self.compact, daemon=True).start()
+
+    def scores(self):
+        """Return {target: current frecency score}."""
+        with self._lock:
+            self._load()
+            factor = self._decay(time.time() - self._reference)
+            return {k: v * factor for k, v in self._scores.items()}
+
+    def compact(self):
+        """Fold the log into the score file and truncate the log."""
+        with self._lock:
+            self._load()
+            log_path, scores_path = self._paths()
+            self._scores = {k: v for k, v in self._scores.items() if v >= USAGE_MIN_SCORE}
+            data = {'reference': self._reference, 'scores': self._scores}
+            try:
+                write_file_atomic(scores_path, json.dumps(data))
+                open(log_path, 'w').close()
+                self._log_lines = 0
+                self._log_needs_newline = False
+            except OSError as e:
+                print(f"Error compacting usage log: {e}")
+
+def write_file_atomic(path, data):
+    """Write text or bytes to path via a temp file and rename, so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    try:
+        binary = isinstance(data, bytes)
+        with os.fdopen(fd, 'wb' if binary else 'w', encoding=None if binary else 'utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+USAGE = UsageTracker()
+
+# === Search Index ===
+class SearchIndex:
+    """Trigram index over tool label, description and category.
+
+    Built once per catalog version. Queries of three or more characters
+    intersect trigram postings; shorter queries scan the pre-lowered text.
+    A query that extends the previous one only re-checks the previous hits,
+    so typing narrows the candidate set keystroke by keystroke.
+    """
+
+    def __init__(self, tools):
+        self.tools = tools
+        self.labels = []
+        self.texts = []
+        self.postings = {}  # trigram -> ascending list of tool indices
+        for i, (label, _, desc, category) in enumerate(tools):
+            label = label.lower()
+            text = f"{label}\n{desc}\n{category}".lower()
+            self.labels.append(label)
+            self.texts.append(text)
+            for gram in {text[j:j + 3] for j in range(len(text) - 2)}:
+                self.postings.setdefault(gram, []).append(i)
+        self._last_query = None
+        self._last_hits = None
+
+    def _candidates(self, query):
+        if self._last_query and query.startswith(self._last_query):
+            return self._last_hits
+        if len(query) < 3:
+            return range(len(self.texts))
+        lists = []
+        for gram in {query[j:j + 3] for j in range(len(query) - 2)}:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            lists.append(posting)
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for posting in lists[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query, scores=None):
+        """Return matching tool indices, best match first.
+
+        scores, if given, is a frecency score per tool used to order tools
+        within the same match rank.
+        """
+        query = query.strip().lower()
+        if not query:
+            self._last_query = None
+            return rank_by_score(range(len(self.tools)), scores)
+        texts = self.texts
+        hits = [i for i in sorted(self._candidates(query)) if query in texts[i]]
+        self._last_query = query
+        self._last_hits = hits
+
+        # Rank by where the query hits the label; config order breaks ties
+        prefix, word, inner, other = [], [], [], []
+        word_query = f" {query}"
+        labels = self.labels
+        for i in hits:
+            label = labels[i]
+            if label.startswith(query):
+                prefix.append(i)
+            elif word_query in label:
+                word.append(i)
+            elif query in label:
+                inner.append(i)
+            else:
+                other.append(i)
+        return (rank_by_score(prefix, scores) + rank_by_score(word, scores) +
+                rank_by_score(inner, scores) + rank_by_score(other, scores))
+
+def rank_by_score(indices, scores):
+    """Order indices by descending score; equal scores keep their order."""
+    if not scores:
+        return list(indices)
+    return sorted(indices, key=lambda i: -scores[i])
+
+# === URL Health Checks ===
+HEALTH_TTL = 300  # Seconds before a probe result is refreshed
+HEALTH_TIMEOUT = 3.0  # Connect/read timeout per probe
+HEALTH_MAX_HOSTS = 8  # Hosts probed at the same time
+HEALTH_RATE = 10.0  # Probe requests per second across all hosts
+
+def health_url(target):
+    """Return target as an http(s) URL to probe, or None if it isn't one."""
+    if target.lower().startswith('www.'):
+        target = "http://" + target
+    parts = urllib.parse.urlsplit(target)
+    if parts.scheme.lower() not in ('http', 'https') or not parts.netloc:
+        return None
+    return parts
+
+class HealthChecker:
+    """Background reachability probes for url tools, cached for ttl seconds.
+
+    URLs are grouped by host and each host is probed by one worker over a
+    single keep-alive connection, at most max_hosts hosts at a time, with a
+    global rate limit on requests. check() only schedules probes and never
+    blocks; on_update is called from the worker as results arrive.
+
+    Results are (state, detail, checked_at) where state is "up" (any
+    response below 400, or 401/403), "error" (other HTTP errors, TLS
+    failures) or "down" (no connection or timeout).
+    """
+
+    def __init__(self, ttl=HEALTH_TTL, timeout=HEALTH_TIMEOUT, max_hosts=HEALTH_MAX_HOSTS,
+                 rate=HEALTH_RATE, on_update=None):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_hosts = max_hosts
+        self.rate = rate
+        self.on_update = on_update
+        self.results = {}  # target -> (state, detail, checked_at)
+        self._inflight = set()  # (scheme, netloc) currently being probed
+        self._lock = threading.Lock()
+        self._next_slot = 0.0  # Rate limiter: earliest start of the next request
+        self._executor = None
+        self.probes = 0
+
+    def status(self, target):
+        """Return the last known state of target, or None if never probed."""
+        result = self.results.get(target)
+        return result[0] if result else None
+
+    def check(self, targets):
+        """Schedule probes for targets with no result or one older than ttl."""
+        now = time.monotonic()
+        by_host = {}
+        with self._lock:
+            for target in targets:
+                result = self.results.get(target)
+                if result is not None and now - result[2] < self.ttl:
+                    continue
+                parts = health_url(target)
+                if parts is None:
+                    continue
+                host = (parts.scheme.lower(), parts.netloc)
+                if host not in self._inflight:
+                    by_host.setdefault(host, []).append((target, parts))
+            self._inflight.update(by_host)
+            if by_host and self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_hosts,
+                                                    thread_name_prefix="health")
+        for host, entries in by_host.items():
+            self._executor.submit(self._probe_host, host, entries)
+        return len(by_host)
+
+    def _throttle(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            self._next_slot = start + 1.0 / self.rate
+        if start > now:
+            time.sleep(start - now)
+
+    def _probe_host(self, host, entries):
+        import http.client
+        scheme, netloc = host
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        conn = connection_class(netloc, timeout=self.timeout)
+        try:
+            for target, parts in entries:
+                self._throttle()
+                result = self._probe(conn, parts)
+                with self._lock:
+                    self.results[target] = result
+                    self.probes += 1
+                if self.on_update is not None:
+                    self.on_update()
+        except Exception as e:
+            print(f"Health check for {netloc} failed: {e}")
+        finally:
+            conn.close()
+            with self._lock:
+                self._inflight.discard(host)
+
+    def _probe(self, conn, parts):
+        import http.client
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        headers = {'User-Agent': "ToolLauncher health check"}
+        try:
+            conn.request("HEAD", path, headers=headers)
+            response = conn.getresponse()
+            response.read()  # Empty for HEAD; keeps the connection reusable
+            if response.status in (405, 501):
+                # HEAD not supported: ask with GET but don't download the body
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                conn.close()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()  # Reconnects on the next request
+            state = "error" if e.__class__.__module__ == 'ssl' else "down"
+            return (state, str(e) or e.__class__.__name__, time.monotonic())
+        code = response.status
+        state = "up" if code < 400 or code in (401, 403) else "error"
+        return (state, f"HTTP {code}", time.monotonic())
+
+    def stats(self):
+        with self._lock:
+            states = [result[0] for result in self.results.values()]
+            inflight = len(self._inflight)
+        return {'probes': self.probes, 'hosts_in_flight': inflight,
+                'up': states.count("up"), 'error': states.count("error"),
+                'down': states.count("down")}
+
+def health_checks_enabled():
+    return CATALOG.get_setting('health_checks', 'on').strip().lower() not in ('off', 'false', 'no', '0')
+
+def refresh_tile_badges():
+    if POPUP is not None and POPUP.exists():
+        POPUP.refresh_badges()
+
+HEALTH = HealthChecker(on_update=lambda: DISPATCHER.post("health", refresh_tile_badges, coalesce=True))
+
+# === Target Resolution ===
+RESOLVE_TTL = 60  # Seconds before the index is rebuilt to notice installed/removed files
+
+def target_base_dirs():
+    """Folders a relative path/command target is looked up in, in order."""
+    script_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else os.path.abspath(__file__))
+    return [get_app_dir(), script_dir]
+
+def resolve_target(target, command=False):
+    """Work out how to start a path or command target.
+
+    Returns (argv, direct, error): argv[0] is the absolute path of the file or
+    program and the rest are the command's arguments; direct means argv can be
+    spawned as is rather than handed to the platform opener. error is a
+    message (and argv the unresolved target) if nothing was found.
+
+    Relative names are looked up next to the config, then next to
+    ToolLauncher itself, then on PATH; bare command names try PATH first.
+    On Windows a bare name found nowhere is left for os.startfile, since
+    ShellExecute also knows App Paths programs (chrome.exe, winword.exe)
+    that are not on PATH; such entries have no error and stay unverified.
+    """
+    if command:
+        try:
+            argv = command_argv(target)
+            if isinstance(argv, str):
+                argv = [arg.strip('"') for arg in shlex.split(argv, posix=False)]
+        except ValueError as e:
+            return ([target], False, f"Cannot parse command {target!r}: {e}")
+        if not argv:
+            return ([target], False, "Empty command")
+        name, args = argv[0], argv[1:]
+    elif len(urllib.parse.urlsplit(target).scheme) > 1:
+        return ([target], False, None)  # mailto:, ms-settings: etc. go to the opener as is
+    else:
+        name, args = target, []
+    name = os.path.expandvars(os.path.expanduser(name))
+
+    bare = not any(sep in name for sep in (os.sep, os.altsep) if sep)
+    if os.path.isabs(name):
+        candidates = [name]
+    else:
+        candidates = [os.path.join(base, name) for base in target_base_dirs()]
+        if bare:
+            found = shutil.which(name)  # PATH search, with PATHEXT on Windows
+            if found:
+                candidates.insert(0 if command else len(candidates), found)
+
+    for candidate in candidates:
+        if not os.path.exists(candidate):
+            continue
+        path = os.path.abspath(candidate)
+        executable = os.path.isfile(path) and os.access(path, os.X_OK)
+        if command and sys.platform != 'win32' and not executable:
+            return ([target], False, f"{path} is not executable")
+        return ([path] + args, command or (executable and sys.platform != 'win32'), None)
+    if bare and sys.platform == 'win32':
+        return ([name] + args, False, None)
+    return ([target], False, f"{name} was not found")
+
+class TargetResolver:
+    """Index of resolved path/command targets, built off the Tk thread.
+
+    refresh() rebuilds the index in the background when the catalog or PATH
+    changed, or it is older than RESOLVE_TTL. Clicks use cached() on the Tk
+    thread; targets missing from the index or broken are re-resolved by
+    lookup() on the launch pool, so a file installed since the last build
+    launches without waiting for it.
+    """
+
+    def __init__(self, on_update=None):
+        self.index = {}  # target -> (argv, direct, error)
+        self.key = None  # (catalog version, PATH) the index was built for
+        self.built_at = 0.0
+        self.on_update = on_update  # Called from the worker when broken entries changed
+        self.builds = 0
+        self.hits = 0
+        self.misses = 0
+        self._building = False
+        self._lock = threading.Lock()
+
+    def _current_key(self):
+        return (CATALOG.version, os.environ.get('PATH', ''))
+
+    def refresh(self):
+        key = self._current_key()
+        with self._lock:
+            if self._building or (key == self.key and time.monotonic() - self.built_at < RESOLVE_TTL):
+                return
+            self._building = True
+        threading.Thread(target=self._build, daemon=True, name="resolve").start()
+
+    def _build(self):
+        try:
+            key = self._current_key()
+            index = {target: resolve_target(target, command)
+                     for target, command in CATALOG.local_targets()}
+        except Exception as e:
+            print(f"Error resolving tool targets: {e}")
+            with self._lock:
+                self._building = False
+            return
+        with self._lock:
+            before = {target for target, entry in self.index.items() if entry[2]}
+            self.index, self.key = index, key
+            self.built_at = time.monotonic()
+            self.builds += 1
+            self._building = False
+        if before != {target for target, entry in index.items() if entry[2]} and self.on_update:
+            self.on_update()
+
+    def cached(self, target):
+        """Return the indexed (argv, direct, error) for target if it is usable, else None.
+
+        Never touches the filesystem, so it is safe on the Tk thread.
+        """
+        with self._lock:
+            entry = self.index.get(target)
+            if self.key is not None and self.key[1] != os.environ.get('PATH', ''):
+                return None
+        if entry is not None and not entry[2]:
+            self.hits += 1
+            return entry
+        return None
+
+    def lookup(self, target, command=False):
+        """Return (argv, direct, error) for target, resolving it now if needed.
+
+        Resolving may block on slow or unreachable paths; call it off the Tk thread.
+        """
+        entry = self.cached(target)
+        if entry is not None:
+            return entry
+        self.misses += 1
+        entry = resolve_target(target, command)
+        with self._lock:
+            self.index[target] = entry
+        return entry
+
+    def status(self, target):
+        """Return "down" if target is known to be broken, else None."""
+        entry = self.index.get(target)
+        return "down" if entry is not None and entry[2] else None
+
+    def stats(self):
+        with self._lock:
+            broken = sum(1 for entry in self.index.values() if entry[2])
+            return {'resolved': len(self.index), 'broken': broken, 'builds': self.builds,
+                    'hits': self.hits, 'misses': self.misses}
+
+def tile_status(target):
+    """Badge state for a tile: reachability for URLs, "down" for broken local targets."""
+    if health_url(target) is not None:
+        return HEALTH.status(target)
+    return RESOLVER.status(target)
+
+RESOLVER = TargetResolver(on_update=lambda: DISPATCHER.post("resolve", refresh_tile_badges, coalesce=True))
+
+# === Tile Icons ===
+ICON_SIZE = 20  # Thumbnail edge in pixels
+ICON_MEMORY_BUDGET = 4 * 1024 * 1024  # Bytes of decoded icons kept in the LRU
+ICON_EXTENSIONS = ('.png', '.ico', '.gif', '.jpg', '.jpeg', '.bmp')
+FAVICON_DIR = "favicons"  # <app dir>/favicons/<host>.png|.ico is used for url tools
+THUMBNAIL_DIR = "thumbnails"  # <app dir>/thumbnails/<hash>.png, resized icons
+
+def icon_source(target):
+    """Return the image file to use as target's icon, or None.
+
+    Tried in order: the tool's icon = key (relative to the config folder),
+    the target itself if it is an image file, and a favicon already saved
+    under FAVICON_DIR for url targets. Never touches the network.
+    """
+    app_dir = get_app_dir()
+    icon = CATALOG.icon_for(target)
+    if icon:
+        icon = os.path.expandvars(os.path.expanduser(icon))
+        return icon if os.path.isabs(icon) else os.path.join(app_dir, icon)
+    if not is_url(target) and target.lower().endswith(ICON_EXTENSIONS):
+        return target
+    parts = health_url(target)
+    if parts is not None and parts.hostname:
+        for ext in ('.png', '.ico'):
+            path = os.path.join(app_dir, FAVICON_DIR, parts.hostname + ext)
+            if os.path.exists(path):
+                return path
+    return None
+
+class IconCache:
+    """Tile icons, loaded on a worker pool and kept in a memory-bounded LRU.
+
+    get() runs on the Tk thread and returns a PhotoImage or None; a miss
+    queues a load. Workers find the source and either read its resized PNG
+    from the thumbnail cache on disk (keyed by source path, mtime and size)
+    or decode and resize it with PIL and store the thumbnail. Only creating
+    the PhotoImage happens on the Tk thread, from a coalesced dispatcher
+    event, after which on_ready() is called.
+    """
+
+    def __init__(self, size=ICON_SIZE, memory_budget=ICON_MEMORY_BUDGET, max_workers=2,
+                 on_ready=None):
+        self.size = size
+        self.max_images = max(1, memory_budget // (size * size * 4))
+        self.max_workers = max_workers
+        self.on_ready = on_ready
+        self._images = OrderedDict()  # target -> PhotoImage, least recently used first
+        self._loading = set()
+        self._missing = set()  # Targets without a usable icon
+        self._done = deque()  # (target, PNG bytes or None) handed back by workers
+        self._executor = None
+        self._pil_missing = False
+        self.hits = 0
+        self.misses = 0
+        self.thumbnail_hits = 0
+        self.decoded = 0
+        self.evicted = 0
+
+    def get(self, target):
+        """Return the icon for target, or None (queueing a load if needed)."""
+        image = self._images.get(target)
+        if image is not None:
+            self._images.move_to_end(target)
+            self.hits += 1
+            return image
+        if target in self._loading or target in self._missing:
+            return None
+        self.misses += 1
+        self._loading.add(target)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="icons")
+        self._executor.submit(self._load, target)
+        return None
+
+    def reset_missing(self):
+        """Let targets that had no icon be looked up again (after a catalog change)."""
+        self._missing.clear()
+
+    def clear(self):
+        """Drop every decoded icon (thumbnails on disk are kept)."""
+        self._images.clear()
+        self._missing.clear()
+
+    def _load(self, target):
+        data = None
+        try:
+            source = icon_source(target)
+            if source is not None:
+                data = self._thumbnail(source)
+        except ImportError:
+            if not self._pil_missing:
+                print("Pillow is not installed; tile icons are disabled")
+            self._pil_missing = True
+        except Exception as e:
+            print(f"Error loading icon for {target}: {e}")
+        self._done.append((target, data))
+        DISPATCHER.post("icons", self._deliver, coalesce=True)
+
+    def _thumbnail(self, source):
+        """Return the resized PNG for source, from the disk cache when possible."""
+        st = os.stat(source)
+        key = f"{os.path.abspath(source)}|{st.st_mtime_ns}|{st.st_size}|{self.size}"
+        path = os.path.join(get_app_dir(), THUMBNAIL_DIR,
+                            hashlib.sha1(key.encode('utf-8')).hexdigest() + ".png")
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.thumbnail_hits += 1
+            return data
+        except FileNotFoundError:
+            pass
+        from PIL import Image
+        with Image.open(source) as image:
+            image = image.convert("RGBA")
+            image.thumbnail((self.size, self.size), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, "PNG")
+        self.decoded += 1
+        data = buffer.getvalue()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_file_atomic(path, data)
+        except OSError as e:
+            print(f"Could not cache thumbnail for {source}: {e}")
+        return data
+
+    def _deliver(self):
+        """Turn finished loads into PhotoImages (Tk thread)."""
+        added = False
+        while self._done:
+            target, data = self._done.popleft()
+            self._loading.discard(target)
+            if data is None:
+                self._missing.add(target)
+                continue
+            try:
+                self._images[target] = tk.PhotoImage(data=base64.b64encode(data))
+            except tk.TclError as e:
+                print(f"Unusable icon for {target}: {e}")
+                self._missing.add(target)
+                continue
+            added = True
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+            self.evicted += 1
+        if added and self.on_ready is not None:
+            self.on_ready()
+
+    def stats(self):
+        return {'cached': len(self._images), 'hits': self.hits, 'misses': self.misses,
+                'thumbnail_hits': self.thumbnail_hits, 'decoded': self.decoded,
+                'evicted': self.evicted}
+
+def refresh_tile_icons():
+    if POPUP is not None and POPUP.exists():
+        POPUP.refresh_icons()
+
+ICONS = IconCache(on_ready=refresh_tile_icons)
+
+# === GUI Popup ===
+def launch_popup():
+    """Ask the Tk loop to show the popup (called from the tray/IPC threads)."""
+    DISPATCHER.post("show", show_popup, time.perf_counter(), coalesce=True)
+
+def toggle_popup():
+    """Hotkey callback: show the popup, or hide it if it is already up."""
+    DISPATCHER.post("toggle", _toggle_popup, time.perf_counter(), coalesce=True)
+
+def _toggle_popup(requested_at):
+    if POPUP is not None and POPUP.is_visible():
+        POPUP.hide()
+    else:
+        show_popup(requested_at)
+
+def group_tools(tools):
+    """Group tools by category (empty category -> "General"), keeping config order."""
+    categories = {}
+    for label, url, desc, category in tools:
+        key = category.strip() if category and category.strip() else "General"
+        categories.setdefault(key, []).append((label, url, desc))
+    return categories
+
+# === Layout Engine ===
+CATEGORY_FONT = ("Segoe UI", 12, "bold")
+TITLE_FONT = ("Segoe UI", 10, "bold")
+DESC_FONT = ("Segoe UI", 9)
+MIN_COL_WIDTH = 200  # Minimum width per column
+MAX_COL_WIDTH = 380  # Wider text wraps instead of widening the column
+MIN_BOX_HEIGHT = 50
+MAX_DESC_LINES = 4  # Longer descriptions are clipped by the tile
+LAYOUT_CACHE_SIZE = 4
+
+class TextMetrics:
+    """Tk font measurements, memoized by (font, text) and (font, text, wraplength)."""
+
+    def __init__(self, master, maxsize=8192):
+        self.master = master
+        self._fonts = {}
+        self.measure = lru_cache(maxsize=maxsize)(self._measure)
+        self.line_count = lru_cache(maxsize=maxsize)(self._line_count)
+
+    def font(self, spec):
+        font = self._fonts.get(spec)
+        if font is None:
+            font = self._fonts[spec] = tkfont.Font(root=self.master, font=spec)
+        return font
+
+    def linespace(self, spec):
+        return self.font(spec).metrics("linespace")
+
+    def _measure(self, spec, text):
+        return self.font(spec).measure(text)
+
+    def _line_count(self, spec, text, wraplength):
+        """Number of lines Tk needs to show text wrapped at wraplength pixels."""
+        if not text:
+            return 0
+        space = self.measure(spec, " ")
+        lines = 0
+        for paragraph in text.split("\n"):
+            lines += 1
+            width = 0
+            for word in paragraph.split():
+                word_width = self.measure(spec, word)
+                if width and width + space + word_width > wraplength:
+                    lines += 1
+                    width = 0
+                if word_width > wraplength:
+                    # Words longer than a line are broken across lines
+                    extra = int(word_width // wraplength)
+                    lines += extra
+                    width = word_width - extra * wraplength
+                else:
+                    width = width + space + word_width if width else word_width
+        return lines
+
+    def cache_info(self):
+        return {'measure': self.measure.cache_info(), 'line_count': self.line_count.cache_info()}
+
+TEXT_METRICS = None  # Created on first layout; needs the Tk root
+LAYOUT_CACHE = OrderedDict()  # (catalog, theme) hash -> layout, most recent last
+
+def get_text_metrics():
+    global TEXT_METRICS
+    if TEXT_METRICS is None:
+        TEXT_METRICS = TextMetrics(root)
+    return TEXT_METRICS
+
+def compute_layout(tools, categories, dark, measure_heights=True):
+    """Measure column widths and tile heights for the grouped tools.
+
+    Returns {'col_widths': {cat: px}, 'heights': {cat: [px per tile]},
+    'content_height': px}. Results are cached by a hash of the catalog and
+    theme, so re-showing an unchanged catalog costs no measurement.
+    With measure_heights=False (virtual mode, where rows have a fixed
+    pitch) the per-word wrapping pass is skipped and 'heights' is empty.
+    """
+    cache_key = hash((tuple(tools), dark, measure_heights))
+    layout = LAYOUT_CACHE.get(cache_key)
+    if layout is not None:
+        LAYOUT_CACHE.move_to_end(cache_key)
+        return layout
+
+    metrics = get_text_metrics()
+    title_line = metrics.linespace(TITLE_FONT)
+    desc_line = metrics.linespace(DESC_FONT)
+    col_widths = {}
+    heights = {}
+    content_height = 0
+    for cat, items in categories.items():
+        # Widest single-line text decides the column, within the min/max bounds
+        cat_width = metrics.measure(CATEGORY_FONT, cat)
+        for label, _, desc in items:
+            cat_width = max(cat_width, metrics.measure(TITLE_FONT, label),
+                            metrics.measure(DESC_FONT, desc))
+        col_width = min(MAX_COL_WIDTH, max(MIN_COL_WIDTH, cat_width + 40))  # Add padding
+        col_widths[cat] = col_width
+        if not measure_heights:
+            continue
+
+        wrap = col_width - 40  # Tile padding on both sides
+        column_heights = []
+        for label, _, desc in items:
+            title_lines = metrics.line_count(TITLE_FONT, label, wrap)
+            desc_lines = min(MAX_DESC_LINES, metrics.line_count(DESC_FONT, desc, wrap))
+            # Border, highlight and inner padding add 16px around the text
+            column_heights.append(max(MIN_BOX_HEIGHT,
+                                      16 + title_lines * title_line + desc_lines * desc_line))
+        heights[cat] = column_heights
+        # Category header and underline, then each box with its pack padding
+        content_height = max(content_height, 40 + sum(h + 8 for h in column_heights))
+
+    layout = {'col_widths': col_widths, 'heights': heights, 'content_height': content_height}
+    LAYOUT_CACHE[cache_key] = layout
+    if len(LAYOUT_CACHE) > LAYOUT_CACHE_SIZE:
+        LAYOUT_CACHE.popitem(last=False)
+    return layout
+
+class LauncherPopup:
+    """The launcher window, built once and then shown/hidden.
+
+    Each call to sync() diffs the catalog against the tiles already on screen
+    and only creates, destroys or resizes what changed. A warm show with an
+    unchanged catalog is just a deiconify.
+    """
+
+    col_padding = 20
+
+    def __init__(self, master):
+        self.master = master
+        self.window = None
+        self.dark = None
+        self.catalog_version = None
+        self.geometry = None
+        self.columns = {}  # category -> {'frame', 'keys', 'shown'}
+        self.tiles = {}    # tile key -> {'frame', 'labels', 'widgets', 'hover_script', 'normal_script'}
+        self.widget_tiles = {}  # widget path -> tile key, for delegated events
+        self.hovered = None  # Key of the tile currently drawn with the hover colour
+        self.virtual = None  # VirtualTileCanvas when the catalog is large
+        self.virtual_mode = False
+        self.tools = []
+        self.tool_keys = []  # Tile key for each entry in self.tools
+        self.category_order = []
+        self.col_widths = {}
+        self.matches = []  # Indices into self.tools currently shown, best first
+        self.scores = []  # Frecency score per entry in self.tools
+        self.usage_version = None
+        self._index_thread = None
+        self._index_holder = {}
+
+    # --- Window lifecycle ---
+    def _build_window(self):
+        dark = self.dark
+        palette = self.palette = get_palette(dark)
+        bg_color, fg_color = palette['bg'], palette['fg']
+
+        self.window = tk.Toplevel(self.master)
+        self.window.title("ToolLauncher")
+        self.window.configure(bg=bg_color)
+        self.window.attributes("-topmost", True)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.window.bind("<Escape>", lambda e: self.hide())
+        self.window.bind("<Map>", self._on_map)
+        self.map_requested_at = None
+
+        # Tile events are handled once for all tiles through a shared bindtag
+        self.window.bind_class(TILE_BINDTAG, "<Enter>", self._on_tile_enter)
+        self.window.bind_class(TILE_BINDTAG, "<Leave>", self._on_tile_leave)
+        self.window.bind_class(TILE_BINDTAG, "<Button-1>", self._on_tile_click)
+
+        # Set window icon
+        try:
+            icon_path = resource_path(ICON_FILE)
+            if os.path.exists(icon_path):
+                self.window.iconbitmap(icon_path)
+        except Exception:
+            pass
+
+        # Create header frame with title and settings button
+        header_frame = tk.Frame(self.window, bg=bg_color)
+        header_frame.pack(pady=(10, 15), padx=10, fill=tk.X)
+
+        header = tk.Label(header_frame, text="Launch Tools:", bg=bg_color, fg=fg_color, font=("Segoe UI", 14, "bold"))
+        header.pack(side=tk.LEFT, expand=True)
+
+        # Settings button (cog icon)
+        def open_settings():
+            show_settings_dialog(self.window, dark, bg_color, fg_color)
+
+        settings_btn = tk.Button(header_frame, text="⚙", bg=bg_color, fg=fg_color,
+                                 font=("Segoe UI", 12), relief=tk.FLAT,
+                                 command=open_settings, cursor="hand2")
+        settings_btn.pack(side=tk.RIGHT, padx=5)
+        settings_btn.configure(activebackground=palette['hover_bg'])
+        settings_btn.configure(activeforeground=fg_color)
+
+        # Search box; typing filters the tiles, Enter launches the top hit
+        self.search_var = tk.StringVar()
+        self.search_entry = tk.Entry(self.window, textvariable=self.search_var,
+                                     bg=palette['entry_bg'], fg=palette['entry_fg'],
+                                     insertbackground=fg_color, font=("Segoe UI", 10),
+                                     relief=tk.SOLID, borderwidth=1)
+        self.search_entry.pack(fill=tk.X, padx=20, pady=(0, 10))
+        self.search_entry.bind("<Return>", lambda e: self.launch_top_hit())
+        self._search_trace = self.search_var.trace_add("write", lambda *args: self._apply_filter())
+
+        # One button per workspace; filled in by sync()
+        self.workspace_bar = tk.Frame(self.window, bg=bg_color)
+        self.workspace_bar.pack(fill=tk.X, padx=20)
+        self.workspace_names = None
+
+        self.content_frame = tk.Frame(self.window, bg=bg_color)
+        self.content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.columns = {}
+        self.tiles = {}
+        self.widget_tiles = {}
+        self.hovered = None
+        self.virtual = None
+        self.catalog_version = None
+
+    def exists(self):
+        return self.window is not None and self.window.winfo_exists()
+
+    def has_open_dialogs(self):
+        """Return True if a child Toplevel (e.g. the settings dialog) is still open."""
+        return self.exists() and any(child.winfo_class() == "Toplevel" and child.winfo_exists()
+                                     for child in self.window.winfo_children())
+
+    def destroy(self):
+        if self.exists():
+            # The trace is a Tcl command on the default root, not the window, so
+            # it would keep this popup alive after the window is gone
+            self.search_var.trace_remove("write", self._search_trace)
+            self.window.destroy()
+        self.window = None
+
+    def hide(self):
+        if self.exists():
+            self.window.withdraw()
+            schedule_idle_teardown()
+
+    def is_visible(self):
+        return self.exists() and self.window.winfo_viewable()
+
+    def show(self, requested_at=None):
+        """Bring the popup up to date with the catalog and show it."""
+        dark = is_dark_mode()
+        if not self.exists() or dark != self.dark:
+            # Theme changes restyle every widget, so rebuild from scratch
+            self.destroy()
+            self.dark = dark
+            self._build_window()
+
+        with TRACER.span("config_load"):
+            # Worker threads may re-parse the catalog at any time, so take the
+            # version with the list rather than reading CATALOG.version later
+            tools, version = CATALOG.versioned_tools()
+        if not tools:
+            self.hide()
+            return False
+
+        virtual_mode = len(tools) > get_virtualize_threshold()
+        if version != self.catalog_version or virtual_mode != self.virtual_mode:
+            ICONS.reset_missing()
+            self.virtual_mode = virtual_mode
+            with TRACER.span("widget_build"):
+                self.sync(tools)
+            self.catalog_version = version
+        elif USAGE.version != self.usage_version:
+            # Only the ranking changed: re-order existing tiles
+            self._refresh_scores()
+            self._apply_filter()
+        self.map_requested_at = requested_at
+        if health_checks_enabled():
+            HEALTH.check(tool[1] for tool in tools)
+        RESOLVER.refresh()
+        self.refresh_badges()
+        self.refresh_icons()
+
+        # Every show starts with an empty search
+        if self.search_var.get():
+            self.search_var.set("")
+
+        # place near center-ish; geometry requires int
+        self.window.geometry(self.geometry)
+        self.window.deiconify()
+        self.window.lift()
+        self.window.focus_force()
+        self.search_entry.focus_set()
+        return True
+
+    def _on_map(self, event):
+        # <Map> on the toplevel is the first point the popup is on screen
+        if event.widget is self.window and self.map_requested_at is not None:
+            TRACER.record("hotkey_to_map", time.perf_counter() - self.map_requested_at)
+            self.map_requested_at = None
+
+    def launch_top_hit(self):
+        if self.matches:
+            launch_tool(self.tools[self.matches[0]][1])
+            self.hide()
+
+    # --- Search ---
+    def _start_index_build(self):
+        """Build the search index for the current tools off the Tk thread."""
+        tools = self.tools
+        holder = {}
+
+        def build():
+            holder['index'] = SearchIndex(tools)
+
+        self._index_holder = holder
+        self._index_thread = threading.Thread(target=build, daemon=True)
+        self._index_thread.start()
+
+    def _search(self, query):
+        # The index is normally ready long before the first keystroke
+        self._index_thread.join()
+        return self._index_holder['index'].search(query, self.scores)
+
+    def _refresh_scores(self):
+        usage = USAGE.scores()
+        self.scores = [usage.get(tool[1], 0.0) for tool in self.tools]
+        self.usage_version = USAGE.version
+
+    def _apply_filter(self):
+        """Show only the tiles matching the search box, best match first."""
+        query = self.search_var.get()
+        if query.strip():
+            self.matches = self._search(query)
+        else:
+            self.matches = rank_by_score(range(len(self.tools)), self.scores)
+
+        if self.virtual_mode:
+            self.virtual.set_items(group_tools([self.tools[i] for i in self.matches]),
+                                   self.col_widths)
+            return
+
+        shown = {}
+        for i in self.matches:
+            key = self.tool_keys[i]
+            shown.setdefault(key[0], []).append(key)
+
+        col_index = 0
+        for cat in self.category_order:
+            column = self.columns[cat]
+            keys = shown.get(cat, [])
+            if not keys:
+                column['frame'].grid_remove()
+                continue
+            column['frame'].grid(row=0, column=col_index, sticky="n", padx=(10, 10))
+            col_index += 1
+            # Re-pack only when the visible tiles or their order changed
+            if column['shown'] != keys:
+                for key in column['shown']:
+                    self.tiles[key]['frame'].pack_forget()
+                for key in keys:
+                    self.tiles[key]['frame'].pack(pady=4)
+                column['shown'] = keys
+
+    # --- Incremental updates ---
+    def sync(self, tools):
+        """Bring the tile view up to date with tools and recompute the geometry."""
+        categories = group_tools(tools)
+        # Virtual mode draws fixed-pitch rows, so only the column widths are needed
+        layout = compute_layout(tools, categories, self.dark, measure_heights=not self.virtual_mode)
+        col_widths = layout['col_widths']
+        self.tools = tools
+        self.col_widths = col_widths
+        self.category_order = list(categories)
+
+        # Key each tile by its contents; repeated identical entries get an index
+        seen = {}
+        self.tool_keys = []
+        for label, url, desc, category in tools:
+            cat = category.strip() if category and category.strip() else "General"
+            entry = (label, url, desc)
+            n = seen.get((cat, entry), 0)
+            seen[(cat, entry)] = n + 1
+            self.tool_keys.append((cat, entry, n))
+        self._start_index_build()
+        self._refresh_scores()
+        self._sync_workspace_bar()
+
+        if self.virtual_mode:
+            self._clear_widget_tiles()
+            if self.virtual is None:
+                self.virtual = VirtualTileCanvas(self)
+        else:
+            if self.virtual is not None:
+                self.virtual.destroy()
+                self.virtual = None
+            self._sync_widget_tiles(layout)
+        self._apply_filter()
+
+        # compute total width and height
+        num_cols = max(1, len(categories))
+        if self.virtual_mode:
+            max_rows = max(len(items) for items in categories.values())
+            content_height = VirtualTileCanvas.header_height + max_rows * VirtualTileCanvas.pitch
+        else:
+            content_height = layout['content_height']
+        height = 95 + content_height  # Header and search box above the columns
+        if self.workspace_names:
+            height += 35
+        width = sum(col_widths.values()) + (num_cols + 1) * self.col_padding
+        if self.virtual_mode:
+            # The canvas scrolls, so keep the window on screen
+            width = min(width, self.window.winfo_screenwidth() - 100)
+            height = min(height, self.window.winfo_screenheight() - 150)
+        self.geometry = f"{int(width)}x{int(height)}+600+300"
+
+    def _sync_workspace_bar(self):
+        names = list(CATALOG.workspaces())
+        if names == self.workspace_names:
+            return
+        self.workspace_names = names
+        for child in self.workspace_bar.winfo_children():
+            child.destroy()
+        palette = self.palette
+        for name in names:
+            def on_workspace(name=name):
+                run_workspace(name)
+                self.hide()
+            btn = tk.Button(self.workspace_bar, text=f"▶ {name}", command=on_workspace,
+                            bg=palette['secondary_bg'], fg=palette['fg'],
+                            activebackground=palette['secondary_active'],
+                            activeforeground=palette['fg'],
+                            font=("Segoe UI", 9), relief=tk.FLAT, cursor="hand2")
+            btn.pack(side=tk.LEFT, padx=(0, 6), pady=(0, 8))
+
+    def _clear_widget_tiles(self):
+        for column in self.columns.values():
+            column['frame'].destroy()
+        self.columns = {}
+        self.tiles = {}
+        self.widget_tiles = {}
+        self.hovered = None
+
+    def _sync_widget_tiles(self, layout):
+        """Diff the tile keys against the existing tile widgets and apply only the changes."""
+        wanted = {cat: [] for cat in self.category_order}
+        for key in self.tool_keys:
+            wanted[key[0]].append(key)
+
+        # Remove tiles and columns that are gone
+        wanted_keys = {key for keys in wanted.values() for key in keys}
+        for key in [k for k in self.tiles if k not in wanted_keys]:
+            tile = self.tiles.pop(key)
+            for widget in tile['widgets']:
+                self.widget_tiles.pop(str(widget), None)
+            tile['frame'].destroy()
+            if key == self.hovered:
+                self.hovered = None
+        for cat in [c for c in self.columns if c not in wanted]:
+            self.columns.pop(cat)['frame'].destroy()
+
+        for cat, keys in wanted.items():
+            column = self.columns.get(cat)
+            if column is None:
+                column = self.columns[cat] = self._build_column(cat)
+            column['shown'] = [key for key in column['shown'] if key in self.tiles]
+
+            box_width = layout['col_widths'][cat] - 20  # Account for padding
+            for key, box_height in zip(keys, layout['heights'][cat]):
+                tile = self.tiles.get(key)
+                if tile is None:
+                    label, url, desc = key[1]
+                    self._register_tile(key, self._build_tile(column['frame'], label, url, desc,
+                                                              box_width, box_height))
+                elif tile['size'] != (box_width, box_height):
+                    self._resize_tile(tile, box_width, box_height)
+            column['keys'] = keys
+
+    def _build_column(self, cat):
+        palette = self.palette
+        col_frame = tk.Frame(self.content_frame, bg=palette['bg'])
+
+        # Category header with underline
+        cat_label = tk.Label(col_frame, text=cat,
+                            font=CATEGORY_FONT,
+                            bg=palette['bg'], fg=palette['fg'])
+        cat_label.pack(anchor="w", pady=(0, 2))
+
+        # Simple underline
+        tk.Frame(col_frame, height=1,
+                bg=palette['underline']).pack(fill=tk.X, pady=(0, 12))
+        return {'frame': col_frame, 'keys': [], 'shown': []}
+
+    def _resize_tile(self, tile, box_width, box_height):
+        tile['frame'].configure(width=box_width, height=box_height)
+        title_label, desc_label = tile['labels']
+        icon_width = ICON_SIZE + 4 if tile['icon'] is not None else 0
+        title_label.configure(wraplength=box_width - 20 - icon_width)
+        desc_label.configure(wraplength=box_width - 20)
+        tile['size'] = (box_width, box_height)
+
+    def _build_tile(self, col_frame, label, url, desc, box_width, box_height):
+        palette = self.palette
+        bg_color, fg_color = palette['bg'], palette['fg']
+
+        # Create clickable frame with border and fixed size
+        tool_frame = tk.Frame(col_frame, bg=bg_color, relief="solid",
+                            borderwidth=1, cursor="hand2",
+                            width=box_width, height=box_height,
+                            highlightbackground=palette['border'],
+                            highlightthickness=1)
+        tool_frame.pack_propagate(False)  # Maintain fixed size
+
+        # Inner padding frame
+        inner_frame = tk.Frame(tool_frame, bg=bg_color, cursor="hand2")
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=6)
+
+        # Labels with wrapping
+        title_label = tk.Label(inner_frame, text=label,
+                             font=TITLE_FONT,
+                             anchor="w", bg=bg_color, fg=fg_color, cursor="hand2",
+                             wraplength=box_width - 20)  # Account for padding
+        title_label.pack(fill=tk.X)
+
+        desc_frame = tk.Frame(inner_frame, bg=bg_color, cursor="hand2")
+        desc_frame.pack(fill=tk.BOTH, expand=True)
+
+        desc_label = tk.Label(desc_frame, text=desc,
+                            font=DESC_FONT,
+                            fg=palette['subtext'], anchor="nw",
+                            justify=tk.LEFT, bg=bg_color, cursor="hand2",
+                            wraplength=box_width - 20)  # Account for padding
+        desc_label.pack(fill=tk.BOTH, expand=True)
+
+        widgets = (tool_frame, inner_frame, title_label, desc_frame, desc_label)
+        # Status dot in the top-right corner (reachability, or a broken
+        # path/command), coloured by refresh_badges()
+        badge = tk.Label(tool_frame, text="", font=DESC_FONT, bg=bg_color, cursor="hand2")
+        badge.place(relx=1.0, x=-4, y=2, anchor="ne")
+        widgets += (badge,)
+
+        # Route this tile's events through the shared bindtag instead of
+        # binding handlers on each widget
+        for widget in widgets:
+            widget.bindtags((TILE_BINDTAG,) + widget.bindtags())
+
+        # Restyling is one Tcl script per state, so hovering is a single call
+        hover_script = "\n".join(f"{w} configure -bg {palette['hover_bg']}" for w in widgets)
+        normal_script = "\n".join(f"{w} configure -bg {bg_color}" for w in widgets)
+        return {'frame': tool_frame, 'labels': (title_label, desc_label), 'url': url,
+                'size': (box_width, box_height), 'badge': badge, 'health': None, 'icon': None,
+                'widgets': widgets, 'hover_script': hover_script, 'normal_script': normal_script}
+
+    def refresh_icons(self):
+        """Put icons on tiles that don't have one yet (loads the missing ones lazily)."""
+        if self.virtual_mode:
+            if self.virtual is not None:
+                self.virtual.refresh_icons()
+            return
+        for tile in self.tiles.values():
+            if tile['icon'] is not None:
+                continue
+            image = ICONS.get(tile['url'])
+            if image is not None:
+                # Keep a reference: the LRU may drop it while the tile still shows it
+                tile['icon'] = image
+                tile['labels'][0].configure(image=image, compound=tk.LEFT)
+                self._resize_tile(tile, *tile['size'])
+
+    def refresh_badges(self):
+        """Recolour status badges whose state changed since the last refresh."""
+        if self.virtual_mode:
+            if self.virtual is not None:
+                self.virtual.refresh_badges()
+            return
+        palette = self.palette
+        for tile in self.tiles.values():
+            badge = tile['badge']
+            state = tile_status(tile['url'])
+            if state != tile['health']:
+                tile['health'] = state
+                if state:
+                    badge.configure(text="●", fg=palette[f'status_{state}'])
+                else:
+                    badge.configure(text="")
+
+    def _register_tile(self, key, tile):
+        self.tiles[key] = tile
+        for widget in tile['widgets']:
+            self.widget_tiles[str(widget)] = key
+
+    # --- Delegated tile events ---
+    def _set_hover(self, key):
+        """Restyle the previously hovered tile and the new one, if they differ."""
+        if key == self.hovered:
+            return
+        if self.hovered in self.tiles:
+            self.window.tk.eval(self.tiles[self.hovered]['normal_script'])
+        if key in self.tiles:
+            self.window.tk.eval(self.tiles[key]['hover_script'])
+        self.hovered = key
+
+    def _on_tile_enter(self, event):
+        self._set_hover(self.widget_tiles.get(str(event.widget)))
+
+    def _on_tile_leave(self, event):
+        # Moving between widgets of the same tile must not flicker, so look
+        # at what the pointer is over now rather than what it just left
+        under = event.widget.winfo_containing(event.x_root, event.y_root)
+        self._set_hover(self.widget_tiles.get(str(under)) if under is not None else None)
+
+    def _on_tile_click(self, event):
+        key = self.widget_tiles.get(str(event.widget))
+        if key in self.tiles:
+            launch_tool(self.tiles[key]['url'])
+            self.hide()
+
+class VirtualTileCanvas:
+    """Draws tool tiles as items on a single Canvas for very large catalogs.
+
+    Only the tiles inside the visible viewport are materialized; scrolling
+    creates the newly exposed ones and deletes those that left the view.
+    Hover and click are resolved from the pointer position with arithmetic,
+    so there are no per-tile widgets or bindings.
+    """
+
+    col_padding = 20
+    header_height = 40
+    box_height = 80
+    row_gap = 8
+    pitch = box_height + row_gap
+
+    def __init__(self, popup):
+        self.popup = popup
+        palette = popup.palette
+        self.bg_color = palette['bg']
+        self.fg_color = palette['fg']
+        self.subtext_color = palette['subtext']
+        self.hover_bg = palette['hover_bg']
+        self.border_color = palette['border']
+        self.underline_color = palette['underline']
+        self.palette = palette
+
+        self.frame = tk.Frame(popup.content_frame, bg=self.bg_color)
+        self.frame.pack(fill=tk.BOTH, expand=True)
+        self.canvas = tk.Canvas(self.frame, bg=self.bg_color, highlightthickness=0)
+        vbar = tk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self._yview)
+        hbar = tk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self._xview)
+        self.canvas.configure(yscrollcommand=vbar.set, xscrollcommand=hbar.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        vbar.grid(row=0, column=1, sticky="ns")
+        hbar.grid(row=1, column=0, sticky="ew")
+        self.frame.rowconfigure(0, weight=1)
+        self.frame.columnconfigure(0, weight=1)
+
+        self.columns = []  # [(x, box_width, items)] in display order
+        self.column_x = []  # Left edges, for bisecting pointer positions
+        self.drawn = {}  # (col, row) -> (rect, title, body, badge, icon) item ids; None if absent
+        self.icons = {}  # (col, row) -> PhotoImage shown by that tile
+        self.hovered = None
 
-DEFAULT_HOTKEY = "ctrl+alt+f"  # Default hotkey if not specified in config
-CONFIG_FILE = "ToolLauncher.conf"
-ICON_FILE = "ToolLauncher_Logo.ico"
-CURRENT_POPUP = None  # Track the current popup window
-CURRENT_HOTKEY = DEFAULT_HOTKEY  # Will be updated from config if specified
+        self.canvas.bind("<Configure>", lambda e: self._render())
+        self.canvas.bind("<Motion>", self._on_motion)
+        self.canvas.bind("<Leave>", lambda e: self._set_hover(None))
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", lambda e: self._scroll(-1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self._scroll(-1))
+        self.canvas.bind("<Button-5>", lambda e: self._scroll(1))
 
-# === Check if Windows is in Dark Mode ===
-def is_dark_mode():
-    try:
-        registry = winreg.ConnectRegistry(None, winreg.HKEY_CURRENT_USER)
-        key = winreg.OpenKey(registry, r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize")
-        value, _ = winreg.QueryValueEx(key, "AppsUseLightTheme")
-        return value == 0
-    except:
-        return False  # Default to light mode if detection fails
+    def destroy(self):
+        self.frame.destroy()
 
-# === Resource Path Resolver ===
-def resource_path(filename):
-    if hasattr(sys, '_MEIPASS'):
-        return os.path.join(sys._MEIPASS, filename)
-    return os.path.join(os.path.abspath(os.path.dirname(__file__)), filename)
+    def set_items(self, categories, col_widths):
+        """Lay out the category columns and draw the visible tiles."""
+        self.canvas.delete("all")
+        self.drawn = {}
+        self.icons = {}
+        self.hovered = None
+        self.columns = []
+        self.column_x = []
 
-# === Launch Handler ===
-def launch_tool(target):
-    """Launch either a URL or an executable."""
-    if target.lower().startswith(('http://', 'https://', 'www.')):
-        # Handle URLs
-        webbrowser.open(target)
-    else:
-        # Handle executable paths
-        try:
-            # Resolve relative paths from the config file location
-            if not os.path.isabs(target):
-                base_dir = os.path.dirname(sys.executable if getattr(sys, 'frozen', False) else __file__)
-                target = os.path.join(base_dir, target)
-            
-            # Use startfile on Windows, subprocess for other platforms
-            if sys.platform == 'win32':
-                os.startfile(target)
-            else:
-                # For Linux/Mac, use appropriate open command
-                if sys.platform == 'darwin':  # macOS
-                    os.system(f'open "{target}"')
-                else:  # Linux
-                    os.system(f'xdg-open "{target}"')
-        except Exception as e:
-            print(f"Error launching {target}: {e}")
+        x = self.col_padding
+        max_rows = 0
+        for cat, items in categories.items():
+            col_width = col_widths[cat]
+            box_width = col_width - 20  # Account for padding
+            # Category headers are few, so they are always drawn
+            self.canvas.create_text(x, 4, text=cat, anchor="nw",
+                                    font=CATEGORY_FONT, fill=self.fg_color)
+            self.canvas.create_line(x, 28, x + box_width, 28, fill=self.underline_color)
+            self.columns.append((x, box_width, items))
+            self.column_x.append(x)
+            max_rows = max(max_rows, len(items))
+            x += col_width + self.col_padding
 
-# === Load Config ===
-def get_config_path():
-    """Get the full path to the config file in AppData."""
-    # Use APPDATA environment variable for more reliable path resolution
-    appdata = os.getenv("APPDATA")
-    if not appdata:
-        # Fallback to expanduser if APPDATA is not set
-        appdata = os.path.join(os.path.expanduser("~"), "AppData", "Roaming")
-    
-    appdata_dir = os.path.join(appdata, "ToolLauncher")
-    return os.path.join(appdata_dir, CONFIG_FILE)
+        pitch = self.pitch
+        self.canvas.configure(scrollregion=(0, 0, x, self.header_height + max_rows * pitch))
+        self._render()
 
-def ensure_config_exists():
-    """Ensure the config file exists and create default one if not."""
-    config_path = get_config_path()
-    config_dir = os.path.dirname(config_path)
-    
-    # Create AppData directory if it doesn't exist
-    if not os.path.exists(config_dir):
-        try:
-            os.makedirs(config_dir, exist_ok=True)
-        except Exception:
+    # --- Viewport ---
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _xview(self, *args):
+        self.canvas.xview(*args)
+        self._render()
+
+    def _scroll(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self._render()
+
+    def _render(self):
+        """Materialize tiles in the viewport and drop those that scrolled out."""
+        canvas = self.canvas
+        left = canvas.canvasx(0)
+        top = canvas.canvasy(0)
+        right = left + canvas.winfo_width()
+        bottom = top + canvas.winfo_height()
+        pitch = self.pitch
+
+        visible = set()
+        first = max(0, int((top - self.header_height) // pitch))
+        last = int((bottom - self.header_height) // pitch)
+        for col, (x, box_width, items) in enumerate(self.columns):
+            if x + box_width < left or x > right:
+                continue
+            for row in range(first, min(last, len(items) - 1) + 1):
+                visible.add((col, row))
+
+        for key in [k for k in self.drawn if k not in visible]:
+            self._delete_tile(key)
+            if key == self.hovered:
+                self.hovered = None
+        for key in visible:
+            if key not in self.drawn:
+                self.drawn[key] = self._draw_tile(*key)
+
+    def _draw_tile(self, col, row):
+        x, box_width, items = self.columns[col]
+        label, _, desc = items[row]
+        y = self.header_height + row * self.pitch
+        wrap = box_width - 20  # Account for padding
+        # Canvas text does not clip, so trim descriptions to what fits in the box
+        max_chars = max(1, wrap // 6) * 3
+        if len(desc) > max_chars:
+            desc = desc[:max_chars - 1] + "…"
+        url = items[row][1]
+        rect = self.canvas.create_rectangle(x, y, x + box_width, y + self.box_height,
+                                            fill=self.bg_color, outline=self.border_color)
+        icon = None
+        title_x = x + 9
+        image = ICONS.get(url)
+        if image is not None:
+            self.icons[(col, row)] = image
+            icon = self.canvas.create_image(title_x, y + 7, image=image, anchor="nw")
+            title_x += ICON_SIZE + 4
+        title = self.canvas.create_text(title_x, y + 7, text=label, anchor="nw",
+                                        width=wrap - (title_x - x - 9),
+                                        font=TITLE_FONT, fill=self.fg_color)
+        body = self.canvas.create_text(x + 9, y + 27, text=desc, anchor="nw", width=wrap,
+                                       font=DESC_FONT, fill=self.subtext_color)
+        badge = self.canvas.create_text(x + box_width - 4, y + 2, anchor="ne", font=DESC_FONT,
+                                        **self._badge_style(url))
+        return (rect, title, body, badge, icon)
+
+    def _delete_tile(self, key):
+        self.canvas.delete(*[item for item in self.drawn.pop(key) if item is not None])
+        self.icons.pop(key, None)
+
+    def refresh_icons(self):
+        # Redraw visible tiles whose icon has finished loading
+        for key in [k for k, items in self.drawn.items() if items[4] is None]:
+            col, row = key
+            if ICONS.get(self.columns[col][2][row][1]) is None:
+                continue
+            self._delete_tile(key)
+            self.drawn[key] = self._draw_tile(col, row)
+            if key == self.hovered:
+                self.canvas.itemconfigure(self.drawn[key][0], fill=self.hover_bg)
+
+    def _badge_style(self, url):
+        state = tile_status(url)
+        if state is None:
+            return {'text': ""}
+        return {'text': "●", 'fill': self.palette[f'status_{state}']}
+
+    def refresh_badges(self):
+        # Only materialized tiles have badges; the rest pick up the state when drawn
+        for (col, row), items in self.drawn.items():
+            self.canvas.itemconfigure(items[3], **self._badge_style(self.columns[col][2][row][1]))
+
+    # --- Pointer handling ---
+    def _tile_at(self, event):
+        x = self.canvas.canvasx(event.x)
+        y = self.canvas.canvasy(event.y) - self.header_height
+        col = bisect.bisect_right(self.column_x, x) - 1
+        if col < 0 or y < 0:
+            return None
+        col_x, box_width, items = self.columns[col]
+        row, offset = divmod(int(y), self.pitch)
+        if x > col_x + box_width or offset > self.box_height or row >= len(items):
+            return None
+        return (col, row)
+
+    def _set_hover(self, key):
+        if key == self.hovered:
             return
-    
-    # Create default config if it doesn't exist
-    if not os.path.exists(config_path):
-        try:
-            config = configparser.ConfigParser()
-            
-            # Add Settings section with default hotkey
-            config['Settings'] = {
-                'hotkey': DEFAULT_HOTKEY
-            }
-            
-            # Add a sample tool section
-            config['Sample_Tool'] = {
-                'label': 'Open Notepad',
-                'path': 'notepad.exe',
-                'description': 'Launch Windows Notepad',
-                'category': 'Utilities'
-            }
-            
-            # Save the default config
-            with open(config_path, 'w') as f:
-                config.write(f)
-        except Exception:
-            pass
+        if self.hovered in self.drawn:
+            self.canvas.itemconfigure(self.drawn[self.hovered][0], fill=self.bg_color)
+        if key in self.drawn:
+            self.canvas.itemconfigure(self.drawn[key][0], fill=self.hover_bg)
+        self.canvas.configure(cursor="hand2" if key is not None else "")
+        self.hovered = key
 
-def load_tools():
-    config = configparser.ConfigParser()
-    config_path = get_config_path()
-    # Check if config file exists
-    if not os.path.exists(config_path):
-        return []
-    config.read(config_path)
-    
-    tools = []
-    # Skip Settings section when processing tools
-    for section in [s for s in config.sections() if s != 'Settings']:
-        # Use section name as label, but allow override with explicit label
-        label = config.get(section, "label", fallback=section)
-        
-        # Try url first, then path, then command
-        target = (config.get(section, "url", fallback=None) or
-                 config.get(section, "path", fallback=None) or
-                 config.get(section, "command", fallback=None))
-        desc = config.get(section, "description", fallback="")
-        category = config.get(section, "category", fallback="")
-        
-        # Only require target now, since label will always have a value
-        if target:
-            tools.append((label, target, desc, category))
-    return tools
+    def _on_motion(self, event):
+        self._set_hover(self._tile_at(event))
 
-# === GUI Popup ===
-def launch_popup():
-    root.after(0, show_popup)
+    def _on_click(self, event):
+        key = self._tile_at(event)
+        if key is None:
+            return
+        col, row = key
+        launch_tool(self.columns[col][2][row][1])
+        self.popup.hide()
 
-def show_popup():
-    global CURRENT_POPUP
-    
-    # If there's an existing popup, destroy it
-    if CURRENT_POPUP is not None and CURRENT_POPUP.winfo_exists():
-        CURRENT_POPUP.destroy()
-    
-    tools = load_tools()
-    if not tools:
-        return
+POPUP = None  # The persistent LauncherPopup, created on first show
 
-    # Group tools by category (empty category -> "General")
-    categories = {}
-    for label, url, desc, category in tools:
-        key = category.strip() if category and category.strip() else "General"
-        categories.setdefault(key, []).append((label, url, desc))
+def show_popup(requested_at=None):
+    """Show the popup; requested_at is the perf_counter() time of the hotkey/tray callback."""
+    global CURRENT_POPUP, POPUP
+    if requested_at is not None:
+        TRACER.record("hotkey_dispatch", time.perf_counter() - requested_at)
+    cancel_idle_teardown()
+    if POPUP is None:
+        POPUP = LauncherPopup(root)
+    POPUP.show(requested_at)
+    CURRENT_POPUP = POPUP.window
 
-    dark = is_dark_mode()
-    bg_color = "#1e1e1e" if dark else "#f0f0f0"
-    fg_color = "#ffffff" if dark else "#000000"
-    subtext_color = "#aaaaaa" if dark else "gray"
+# === Idle Teardown ===
+DEFAULT_IDLE_TEARDOWN_MINUTES = 10  # Minutes hidden before the popup is freed (0 = never)
+IDLE_TIMER = None  # root.after id of the pending teardown
+MEMORY_REPORTS = deque(maxlen=20)  # (wall-clock time, RSS before, RSS after) per teardown
 
-    # Calculate max width needed for each category's content
-    col_padding = 20
-    min_col_width = 200  # Minimum width per column
-    num_cols = max(1, len(categories))
-    
-    # First pass: calculate needed width for each category
-    col_widths = {}
-    for cat, items in categories.items():
-        # Get max width needed for this category's items
-        cat_width = len(cat) * 10  # Estimate pixels needed for category name
-        for label, _, desc in items:
-            # Estimate pixels needed for longest line (label or description)
-            item_width = max(len(label) * 8, len(desc) * 6)  # Rough pixel estimate
-            cat_width = max(cat_width, item_width)
-        col_widths[cat] = max(min_col_width, cat_width + 40)  # Add padding
-    
-    # compute max rows and total width
-    max_rows = max(len(items) for items in categories.values())
-    height = 100 + max_rows * 90
-    width = sum(col_widths.values()) + (num_cols + 1) * col_padding
-
-    CURRENT_POPUP = tk.Toplevel()
-    CURRENT_POPUP.title("ToolLauncher")
-    # place near center-ish; geometry requires int
-    CURRENT_POPUP.geometry(f"{int(width)}x{int(height)}+600+300")
-    CURRENT_POPUP.configure(bg=bg_color)
-    CURRENT_POPUP.attributes("-topmost", True)
-    CURRENT_POPUP.focus_force()
-    
-    # Set window icon
+def resident_memory():
+    """Return this process's resident memory (working set) in bytes, or None if unknown."""
+    if sys.platform == 'win32':
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        try:
+            kernel32 = ctypes.WinDLL('kernel32')
+            psapi = ctypes.WinDLL('psapi')
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            psapi.GetProcessMemoryInfo.argtypes = (wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD)
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            if psapi.GetProcessMemoryInfo(kernel32.GetCurrentProcess(), ctypes.byref(counters),
+                                          counters.cb):
+                return counters.WorkingSetSize
+        except (OSError, AttributeError):
+            pass
+        return None
     try:
-        icon_path = resource_path(ICON_FILE)
-        if os.path.exists(icon_path):
-            CURRENT_POPUP.iconbitmap(icon_path)
-    except Exception:
-        pass
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
 
-    # Create header frame with title and settings button
-    header_frame = tk.Frame(CURRENT_POPUP, bg=bg_color)
-    header_frame.pack(pady=(10, 15), padx=10, fill=tk.X)
-    
-    header = tk.Label(header_frame, text="Launch Tools:", bg=bg_color, fg=fg_color, font=("Segoe UI", 14, "bold"))
-    header.pack(side=tk.LEFT, expand=True)
-    
-    # Settings button (cog icon)
-    def open_settings():
-        show_settings_dialog(CURRENT_POPUP, dark, bg_color, fg_color)
-    
-    settings_btn = tk.Button(header_frame, text="⚙", bg=bg_color, fg=fg_color, 
-                             font=("Segoe UI", 12), relief=tk.FLAT, 
-                             command=open_settings, cursor="hand2")
-    settings_btn.pack(side=tk.RIGHT, padx=5)
-    settings_btn.configure(activebackground=("#2d2d2d" if dark else "#e8e8e8"))
-    settings_btn.configure(activeforeground=fg_color)
+def get_idle_teardown_minutes():
+    value = CATALOG.get_setting('idle_teardown_minutes', '')
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return DEFAULT_IDLE_TEARDOWN_MINUTES
 
-    content_frame = tk.Frame(CURRENT_POPUP, bg=bg_color)
-    content_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+def schedule_idle_teardown():
+    """Restart the teardown countdown; called whenever the popup is hidden (Tk thread)."""
+    global IDLE_TIMER
+    cancel_idle_teardown()
+    minutes = get_idle_teardown_minutes()
+    if minutes > 0 and root is not None:
+        IDLE_TIMER = root.after(int(minutes * 60000), idle_teardown)
 
-    # Create a column for each category
-    for col_index, (cat, items) in enumerate(categories.items()):
-        col_frame = tk.Frame(content_frame, bg=bg_color)
-        col_frame.grid(row=0, column=col_index, sticky="n", padx=(10, 10))
+def cancel_idle_teardown():
+    global IDLE_TIMER
+    if IDLE_TIMER is not None:
+        root.after_cancel(IDLE_TIMER)
+        IDLE_TIMER = None
 
-        # Category header with underline
-        cat_label = tk.Label(col_frame, text=cat, 
-                            font=("Segoe UI", 12, "bold"), 
-                            bg=bg_color, fg=fg_color)
-        cat_label.pack(anchor="w", pady=(0, 2))
-        
-        # Simple underline
-        tk.Frame(col_frame, height=1, 
-                bg="#404040" if dark else "#cccccc").pack(fill=tk.X, pady=(0, 12))
+def idle_teardown():
+    """Free the hidden popup and the caches that only serve it.
 
-        # Calculate fixed box dimensions based on column width
-        box_width = col_widths[cat] - 20  # Account for padding
-        box_height = 80  # Fixed height for all boxes
-        
-        for label, url, desc in items:
-            # Create clickable frame with border and fixed size
-            tool_frame = tk.Frame(col_frame, bg=bg_color, relief="solid",
-                                borderwidth=1, cursor="hand2",
-                                width=box_width, height=box_height)
-            tool_frame.pack(pady=4)
-            tool_frame.pack_propagate(False)  # Maintain fixed size
-            
-            # Border color
-            border_color = "#404040" if dark else "#dddddd"
-            tool_frame.configure(highlightbackground=border_color,
-                               highlightthickness=1)
-            
-            # Inner padding frame
-            inner_frame = tk.Frame(tool_frame, bg=bg_color)
-            inner_frame.pack(fill=tk.BOTH, expand=True, padx=8, pady=6)
-            
-            # Labels with wrapping
-            title_label = tk.Label(inner_frame, text=label, 
-                                 font=("Segoe UI", 10, "bold"),
-                                 anchor="w", bg=bg_color, fg=fg_color,
-                                 wraplength=box_width - 20)  # Account for padding
-            title_label.pack(fill=tk.X)
-            
-            desc_frame = tk.Frame(inner_frame, bg=bg_color)
-            desc_frame.pack(fill=tk.BOTH, expand=True)
-            
-            desc_label = tk.Label(desc_frame, text=desc, 
-                                font=("Segoe UI", 9),
-                                fg=subtext_color, anchor="nw", 
-                                justify=tk.LEFT, bg=bg_color,
-                                wraplength=box_width - 20)  # Account for padding
-            desc_label.pack(fill=tk.BOTH, expand=True)
-            
-            # Bind click and hover events
-            def on_click(target=url):
-                launch_tool(target)
-                CURRENT_POPUP.destroy()
-            
-            def on_enter(e, frame=tool_frame):
-                hover_bg = "#2d2d2d" if dark else "#e8e8e8"
-                frame.configure(bg=hover_bg)
-                for widget in frame.winfo_children():
-                    widget.configure(bg=hover_bg)
-                    for subwidget in widget.winfo_children():
-                        subwidget.configure(bg=hover_bg)
-                    # Handle nested frames (desc_frame)
-                    if isinstance(widget, tk.Frame):
-                        for sub in widget.winfo_children():
-                            sub.configure(bg=hover_bg)
-            
-            def on_leave(e, frame=tool_frame):
-                frame.configure(bg=bg_color)
-                for widget in frame.winfo_children():
-                    widget.configure(bg=bg_color)
-                    for subwidget in widget.winfo_children():
-                        subwidget.configure(bg=bg_color)
-                    # Handle nested frames (desc_frame)
-                    if isinstance(widget, tk.Frame):
-                        for sub in widget.winfo_children():
-                            sub.configure(bg=bg_color)
-            
-            # Bind events to the main frame
-            tool_frame.bind("<Button-1>", lambda e, u=url: on_click(u))
-            tool_frame.bind("<Enter>", on_enter)
-            tool_frame.bind("<Leave>", on_leave)
-            
-            # Make all widgets in the hierarchy clickable
-            def make_clickable(widget):
-                widget.bind("<Button-1>", lambda e, u=url: on_click(u))
-                widget.bind("<Enter>", lambda e, f=tool_frame: on_enter(e, f))
-                widget.bind("<Leave>", lambda e, f=tool_frame: on_leave(e, f))
-                widget.configure(cursor="hand2")
-                if isinstance(widget, tk.Frame):
-                    for child in widget.winfo_children():
-                        make_clickable(child)
-            
-            make_clickable(inner_frame)
+    The next hotkey press rebuilds them (a first-show cost). The catalog,
+    usage scores and health results are kept, so hotkeys and --launch work
+    without re-reading anything. While a dialog opened from the popup is
+    still up, teardown is postponed by another idle period.
+    """
+    global POPUP, CURRENT_POPUP, TEXT_METRICS, IDLE_TIMER
+    IDLE_TIMER = None
+    if POPUP is not None and POPUP.is_visible():
+        return
+    if POPUP is not None and POPUP.has_open_dialogs():
+        schedule_idle_teardown()
+        return
+    before = resident_memory()
+    if POPUP is not None:
+        POPUP.destroy()
+    POPUP = None
+    CURRENT_POPUP = None
+    TEXT_METRICS = None
+    LAYOUT_CACHE.clear()
+    ICONS.clear()
+    gc.collect()
+    after = resident_memory()
+    MEMORY_REPORTS.append((time.time(), before, after))
+    if before is not None and after is not None:
+        print(f"Idle teardown: resident memory {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
 
-    CURRENT_POPUP.bind("<Escape>", lambda e: CURRENT_POPUP.destroy())
+def memory_report():
+    """Return current resident memory and the before/after of recent teardowns."""
+    return {'resident_bytes': resident_memory(),
+            'teardowns': [{'at': at, 'before_bytes': before, 'after_bytes': after}
+                          for at, before, after in MEMORY_REPORTS]}
 
-# === Settings Dialog ===
+# === Config Writes & Bulk Import ===
 def save_config(config):
-    """Save config to file."""
+    """Save config to file atomically (temp file + rename)."""
     config_path = get_config_path()
     try:
-        with open(config_path, 'w') as f:
-            config.write(f)
+        buffer = io.StringIO()
+        config.write(buffer)
+        write_file_atomic(config_path, buffer.getvalue())
+        CATALOG.invalidate()
         return True
     except Exception:
         return False
 
+class ConfigWriter:
+    """Coalesces bursts of config saves into one write.
+
+    schedule() (Tk thread) restarts a short timer; only the latest config is
+    written when it fires, so adding many tools costs one rewrite, not one
+    per tool.
+    """
+
+    def __init__(self, delay_ms=750):
+        self.delay_ms = delay_ms
+        self._pending = None
+        self._after_id = None
+
+    def schedule(self, config):
+        self._pending = config
+        if self._after_id is not None:
+            root.after_cancel(self._after_id)
+        self._after_id = root.after(self.delay_ms, self.flush)
+
+    def cancel(self):
+        if self._after_id is not None:
+            root.after_cancel(self._after_id)
+        self._after_id = None
+        self._pending = None
+
+    def flush(self):
+        """Write the pending config now, if any. Returns False if the write failed."""
+        config, self._pending = self._pending, None
+        self._after_id = None
+        return save_config(config) if config is not None else True
+
+CONFIG_WRITER = ConfigWriter()
+
+def sanitize_section_name(name):
+    """Strip characters that are awkward in section names."""
+    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '_', '-')).strip()
+    return safe_name or "Tool"
+
+def unique_section_name(name, taken, counters):
+    """Return a sanitized section name not in taken, and add it to taken.
+
+    counters remembers the next suffix per base name so repeated names do
+    not rescan from 1 each time.
+    """
+    safe_name = sanitize_section_name(name)
+    unique_name = safe_name
+    counter = counters.get(safe_name, 1)
+    while unique_name in taken:
+        unique_name = f"{safe_name}{counter}"
+        counter += 1
+    counters[safe_name] = counter
+    taken.add(unique_name)
+    return unique_name
+
+def tool_section(label, target, desc="", category=""):
+    """Build the config section for a tool ('%' is escaped for interpolation)."""
+    section = {'label': label.replace('%', '%%'),
+               'url' if is_url(target) else 'path': target.replace('%', '%%')}
+    if desc:
+        section['description'] = desc.replace('%', '%%')
+    if category:
+        section['category'] = category.replace('%', '%%')
+    return section
+
+def _first(row, *names):
+    for name in names:
+        value = row.get(name)
+        if value:
+            return str(value).strip()
+    return ""
+
+def _tools_from_rows(rows):
+    """Map CSV/JSON records (case-insensitive keys) to (label, target, desc, category)."""
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        row = {str(k).strip().lower(): v for k, v in row.items() if k is not None}
+        target = _first(row, 'url', 'path', 'command', 'target', 'href', 'uri')
+        if not target:
+            continue
+        label = _first(row, 'label', 'name', 'title') or target
+        yield (label, target, _first(row, 'description', 'desc'),
+               _first(row, 'category', 'folder', 'group'))
+
+def read_csv_tools(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from _tools_from_rows(csv.DictReader(f))
+
+def read_json_tools(path):
+    """Read a JSON array of objects, or JSON Lines (one object per line, streamed)."""
+    with open(path, encoding='utf-8-sig') as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == '[':
+            yield from _tools_from_rows(json.load(f))
+        else:
+            yield from _tools_from_rows(json.loads(line) for line in f if line.strip())
+
+class _BookmarkParser(HTMLParser):
+    """Collects links from a Netscape bookmark export; folder names become categories."""
+
+    def __init__(self):
+        super().__init__()
+        self.folders = []
+        self.tools = []
+        self._pending_folder = None
+        self._in_folder_title = False
+        self._link = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'h3':
+            self._in_folder_title = True
+            self._text = []
+        elif tag == 'a':
+            self._link = dict(attrs).get('href')
+            self._text = []
+        elif tag == 'dl':
+            self.folders.append(self._pending_folder or "")
+            self._pending_folder = None
+
+    def handle_endtag(self, tag):
+        if tag == 'h3':
+            self._in_folder_title = False
+            self._pending_folder = "".join(self._text).strip()
+        elif tag == 'a' and self._link:
+            label = "".join(self._text).strip() or self._link
+            category = next((name for name in reversed(self.folders) if name), "")
+            self.tools.append((label, self._link, "", category))
+            self._link = None
+        elif tag == 'dl' and self.folders:
+            self.folders.pop()
+
+    def handle_data(self, data):
+        if self._in_folder_title or self._link:
+            self._text.append(data)
+
+def read_bookmark_tools(path, chunk_size=1 << 16):
+    parser = _BookmarkParser()
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for chunk in iter(lambda: f.read(chunk_size), ''):
+            parser.feed(chunk)
+            yield from parser.tools
+            parser.tools.clear()
+    parser.close()
+    yield from parser.tools
+
+IMPORT_READERS = {'.csv': read_csv_tools, '.json': read_json_tools, '.jsonl': read_json_tools,
+                  '.html': read_bookmark_tools, '.htm': read_bookmark_tools}
+
+def import_tools(path, config=None):
+    """Stream tools from a CSV, JSON or bookmark-HTML export into the catalog.
+
+    Entries whose target is already in the catalog are skipped. Section
+    names are de-duplicated against a set, and the config is written once at
+    the end. If config is given the tools are added to it and the caller
+    saves. Returns (added, skipped).
+    """
+    reader = IMPORT_READERS.get(os.path.splitext(path)[1].lower())
+    if reader is None:
+        raise ValueError(f"Unsupported import format: {path}")
+    save = config is None
+    if save:
+        config = CATALOG.copy_config()
+
+    taken, targets = CATALOG.taken_names()
+    taken.update(config.sections())
+    counters = {}
+    targets.update(config.get(s, key, raw=True).replace('%%', '%')
+                   for s in config.sections() for key in ('url', 'path', 'command')
+                   if config.has_option(s, key))
+    added = skipped = 0
+    for label, target, desc, category in reader(path):
+        if target in targets:
+            skipped += 1
+            continue
+        targets.add(target)
+        config[unique_section_name(label, taken, counters)] = tool_section(label, target, desc, category)
+        added += 1
+
+    if save and added and not save_config(config):
+        raise OSError(f"Could not write {get_config_path()}")
+    return added, skipped
+
+# === Settings Dialog ===
 def show_settings_dialog(parent_window, dark, bg_color, fg_color):
     """Show settings dialog for hotkey and adding new tools."""
     settings_window = tk.Toplevel(parent_window)
@@ -346,14 +3057,12 @@ def show_settings_dialog(parent_window, dark, bg_color, fg_color):
         pass
     
     # Load current config
-    config = configparser.ConfigParser()
-    config_path = get_config_path()
-    if os.path.exists(config_path):
-        config.read(config_path)
+    config = CATALOG.copy_config()
     
-    subtext_color = "#999999" if dark else "#666666"
-    entry_bg = "#2d2d2d" if dark else "#ffffff"
-    entry_fg = "#ffffff" if dark else "#000000"
+    palette = get_palette(dark)
+    subtext_color = palette['hint']
+    entry_bg = palette['entry_bg']
+    entry_fg = palette['entry_fg']
     
     # === Button Frame (at bottom) - pack FIRST so it stays at bottom ===
     button_frame = tk.Frame(settings_window, bg=bg_color)
@@ -409,7 +3118,61 @@ def show_settings_dialog(parent_window, dark, bg_color, fg_color):
     tk.Label(scrollable_frame, text="Category (optional)", bg=bg_color, fg=fg_color, font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 3))
     tool_cat_entry = tk.Entry(scrollable_frame, bg=entry_bg, fg=entry_fg, font=("Segoe UI", 10),
                              relief=tk.SOLID, borderwidth=1)
-    tool_cat_entry.pack(fill=tk.X, pady=(0, 20))
+    tool_cat_entry.pack(fill=tk.X, pady=(0, 8))
+    
+    add_row = tk.Frame(scrollable_frame, bg=bg_color)
+    add_row.pack(fill=tk.X, pady=(0, 20))
+    for text, command in (("Add Another", lambda: add_another()), ("Import...", lambda: import_file())):
+        btn = tk.Button(add_row, text=text, command=command,
+                        bg=palette['secondary_bg'], fg=fg_color,
+                        font=("Segoe UI", 9), relief=tk.FLAT, padx=10, pady=3,
+                        cursor="hand2")
+        btn.pack(side=tk.LEFT, padx=(0, 6))
+        btn.configure(activebackground=palette['secondary_active'])
+        btn.configure(activeforeground=fg_color)
+    status_label = tk.Label(add_row, text="", bg=bg_color, fg=subtext_color, font=("Segoe UI", 9))
+    status_label.pack(side=tk.LEFT, padx=(4, 0))
+    
+    taken = CATALOG.taken_names()[0] | set(config.sections())
+    counters = {}
+    
+    def add_tool_from_fields():
+        """Add the tool in the entry fields to config; returns its label or None."""
+        tool_name = tool_name_entry.get().strip()
+        tool_target = tool_target_entry.get().strip()
+        if not (tool_name and tool_target):
+            return None
+        unique_name = unique_section_name(tool_name, taken, counters)
+        config[unique_name] = tool_section(tool_name, tool_target,
+                                           tool_desc_entry.get().strip(),
+                                           tool_cat_entry.get().strip())
+        return tool_name
+    
+    def add_another():
+        """Add the tool and keep the dialog open; saves are coalesced."""
+        tool_name = add_tool_from_fields()
+        if tool_name:
+            for entry in (tool_name_entry, tool_target_entry, tool_desc_entry):
+                entry.delete(0, tk.END)
+            status_label.configure(text=f"Added {tool_name}")
+            tool_name_entry.focus_set()
+            CONFIG_WRITER.schedule(config)
+    
+    def import_file():
+        path = filedialog.askopenfilename(
+            parent=settings_window, title="Import tools",
+            filetypes=[("Tool exports", "*.csv *.json *.jsonl *.html *.htm"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            added, skipped = import_tools(path, config)
+        except (OSError, ValueError, csv.Error) as e:
+            messagebox.showerror("ToolLauncher", f"Import failed:\n{e}", parent=settings_window)
+            return
+        taken.update(config.sections())
+        status_label.configure(text=f"Imported {added} tools ({skipped} duplicates skipped)")
+        if added:
+            CONFIG_WRITER.schedule(config)
     
     def save_settings():
         """Save hotkey and new tool to config."""
@@ -426,56 +3189,93 @@ def show_settings_dialog(parent_window, dark, bg_color, fg_color):
                 pass
         
         # Add new tool if fields are filled
-        tool_name = tool_name_entry.get().strip()
-        tool_target = tool_target_entry.get().strip()
-        
-        if tool_name and tool_target:
-            # Sanitize section name (remove special characters)
-            safe_name = "".join(c for c in tool_name if c.isalnum() or c in (' ', '_', '-')).strip()
-            if not safe_name:
-                safe_name = "Tool"
-            
-            # Ensure unique section name
-            counter = 1
-            unique_name = safe_name
-            while unique_name in config:
-                unique_name = f"{safe_name}{counter}"
-                counter += 1
-            
-            config[unique_name] = {}
-            config[unique_name]['label'] = tool_name
-            config[unique_name]['url' if tool_target.lower().startswith(('http://', 'https://', 'www.')) else 'path'] = tool_target
-            
-            if tool_desc_entry.get().strip():
-                config[unique_name]['description'] = tool_desc_entry.get().strip()
-            
-            if tool_cat_entry.get().strip():
-                config[unique_name]['category'] = tool_cat_entry.get().strip()
+        add_tool_from_fields()
         
-        # Save config
+        # Save config (this write supersedes any coalesced save still pending)
+        CONFIG_WRITER.cancel()
         if save_config(config):
             settings_window.destroy()
-            # Refresh parent popup
-            if parent_window and parent_window.winfo_exists():
-                parent_window.destroy()
+            update_workspace_hotkeys()
+            # Refresh parent popup (only the changed tiles are rebuilt)
             show_popup()
     
     save_btn = tk.Button(button_frame, text="Save", command=save_settings,
-                        bg="#0e639c" if dark else "#007acc", fg="#ffffff",
+                        bg=palette['primary_bg'], fg="#ffffff",
                         font=("Segoe UI", 10, "bold"), relief=tk.FLAT, padx=20, pady=6,
                         cursor="hand2")
     save_btn.pack(side=tk.LEFT, padx=(0, 8))
-    save_btn.configure(activebackground="#1177bb" if dark else "#0059b8")
+    save_btn.configure(activebackground=palette['primary_active'])
     save_btn.configure(activeforeground="#ffffff")
     
     cancel_btn = tk.Button(button_frame, text="Cancel", command=settings_window.destroy,
-                          bg="#3e3e42" if dark else "#e0e0e0", fg=fg_color,
+                          bg=palette['secondary_bg'], fg=fg_color,
                           font=("Segoe UI", 10), relief=tk.FLAT, padx=20, pady=6,
                           cursor="hand2")
     cancel_btn.pack(side=tk.LEFT)
-    cancel_btn.configure(activebackground="#555555" if dark else "#d0d0d0")
+    cancel_btn.configure(activebackground=palette['secondary_active'])
     cancel_btn.configure(activeforeground=fg_color)
 
+# === Performance Stats ===
+def show_stats_window():
+    """Show the latency aggregates with refresh and JSON export (Tk thread)."""
+    palette = get_palette(is_dark_mode())
+    window = tk.Toplevel(root)
+    window.title("ToolLauncher Performance")
+    window.geometry("560x360+650+320")
+    window.configure(bg=palette['bg'])
+    window.attributes("-topmost", True)
+
+    text = tk.Text(window, bg=palette['entry_bg'], fg=palette['entry_fg'],
+                   font=("Consolas", 10), relief=tk.FLAT, wrap=tk.NONE)
+
+    def refresh():
+        lines = [f"{'span':<18}{'count':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}"]
+        for name, agg in sorted(TRACER.summary().items()):
+            lines.append(f"{name:<18}{agg['count']:>7}{agg['p50_ms']:>10.1f}{agg['p95_ms']:>10.1f}"
+                         f"{agg['p99_ms']:>10.1f}{agg['max_ms']:>10.1f}")
+        cache = CATALOG.stats()
+        lines.append("")
+        lines.append(f"config cache: {cache['hits']} hits, {cache['misses']} misses, {cache['reloads']} reloads")
+        memory = memory_report()
+        if memory['resident_bytes'] is not None:
+            lines.append(f"resident memory: {memory['resident_bytes'] / 1e6:.1f} MB")
+        for report in memory['teardowns'][-3:]:
+            if report['before_bytes'] is not None and report['after_bytes'] is not None:
+                lines.append(f"idle teardown at {time.strftime('%H:%M', time.localtime(report['at']))}: "
+                             f"{report['before_bytes'] / 1e6:.1f} MB -> {report['after_bytes'] / 1e6:.1f} MB")
+        text.configure(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        text.insert("1.0", "\n".join(lines))
+        text.configure(state=tk.DISABLED)
+
+    def export():
+        path = filedialog.asksaveasfilename(
+            parent=window, title="Export performance stats",
+            initialdir=os.path.dirname(get_config_path()),
+            initialfile="ToolLauncher_stats.json", defaultextension=".json",
+            filetypes=[("JSON", "*.json")])
+        if path:
+            export_stats(path)
+
+    button_frame = tk.Frame(window, bg=palette['bg'])
+    button_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=8)
+    for label, command in (("Refresh", refresh), ("Export JSON...", export), ("Close", window.destroy)):
+        tk.Button(button_frame, text=label, command=command, bg=palette['secondary_bg'],
+                  fg=palette['fg'], activebackground=palette['secondary_active'],
+                  relief=tk.FLAT, padx=12, pady=4, cursor="hand2").pack(side=tk.LEFT, padx=(0, 6))
+    text.pack(fill=tk.BOTH, expand=True, padx=10, pady=(10, 0))
+    refresh()
+
+def export_stats(path):
+    """Write the tracer snapshot as JSON; returns True on success."""
+    try:
+        with open(path, 'w') as f:
+            json.dump(TRACER.export(), f, indent=2)
+        return True
+    except OSError as e:
+        print(f"Error exporting stats to {path}: {e}")
+        return False
+
 # === Tray Icon ===
 def open_config():
     config_path = get_config_path()
@@ -495,32 +3295,69 @@ def open_config():
 
 def exit_app(icon, item):
     icon.stop()
+    DISPATCHER.post("exit", shutdown)
+
+def shutdown():
+    """Flush pending work and leave the Tk loop (Tk thread)."""
+    CONFIG_WRITER.flush()  # Don't lose coalesced saves that are still pending
+    if INSTANCE_SERVER is not None:
+        INSTANCE_SERVER.stop()
     root.quit()
-    sys.exit()
 
 def create_tray_icon():
-    image = Image.open(resource_path(ICON_FILE))
-    menu = (
-        item("Launch", lambda i, m: launch_popup()),
-        item("Open Config", open_config),
-        item("Exit", exit_app)
-    )
-    icon = pystray.Icon("ToolLauncher", image, "ToolLauncher", menu)
-    threading.Thread(target=icon.run, daemon=True).start()
+    """Set up and run the tray icon on a background thread.
+
+    Importing pystray/PIL and decoding the .ico happen on that thread too,
+    so they never delay the hotkey or the Tk loop. Returns an Event that is
+    set once the icon has been created.
+    """
+    ready = threading.Event()
+
+    def run_tray():
+        try:
+            with startup_phase("tray"):
+                import pystray
+                from pystray import MenuItem as item
+                from PIL import Image
+
+                image = Image.open(resource_path(ICON_FILE))
+
+                def workspace_items():
+                    for name in CATALOG.workspaces():
+                        yield item(name, lambda i, m, name=name: run_workspace(name))
+
+                menu = (
+                    item("Launch", lambda i, m: launch_popup()),
+                    item("Workspaces", pystray.Menu(workspace_items)),
+                    item("Performance stats",
+                         lambda i, m: DISPATCHER.post("stats", show_stats_window, coalesce=True)),
+                    item("Open Config", open_config),
+                    item("Exit", exit_app)
+                )
+                icon = pystray.Icon("ToolLauncher", image, "ToolLauncher", menu)
+        finally:
+            ready.set()
+        icon.run()
+
+    threading.Thread(target=run_tray, daemon=True).start()
+    return ready
 
 # === Hotkey Listener ===
 def get_configured_hotkey():
     """Load the hotkey from config file."""
-    config = configparser.ConfigParser()
-    config_path = get_config_path()
-    if os.path.exists(config_path):
-        config.read(config_path)
-        if 'Settings' in config:
-            hotkey = config['Settings'].get('hotkey', DEFAULT_HOTKEY)
-            if hotkey.strip():  # Ensure it's not empty
-                return hotkey
+    hotkey = CATALOG.get_setting('hotkey', DEFAULT_HOTKEY)
+    if hotkey.strip():  # Ensure it's not empty
+        return hotkey
     return DEFAULT_HOTKEY
 
+def get_virtualize_threshold():
+    """Load the tool count above which the popup switches to the canvas renderer."""
+    value = CATALOG.get_setting('virtualize_threshold', '')
+    try:
+        return int(value)
+    except ValueError:
+        return DEFAULT_VIRTUALIZE_THRESHOLD
+
 def update_hotkey(new_hotkey):
     global CURRENT_HOTKEY
     # Remove old hotkey if it exists and is different
@@ -533,41 +3370,248 @@ def update_hotkey(new_hotkey):
     # Set new hotkey
     try:
         CURRENT_HOTKEY = new_hotkey
-        keyboard.add_hotkey(CURRENT_HOTKEY, launch_popup)
+        keyboard.add_hotkey(CURRENT_HOTKEY, toggle_popup)
     except Exception:
         # Fallback to default if there's an issue
         if new_hotkey != DEFAULT_HOTKEY:
             CURRENT_HOTKEY = DEFAULT_HOTKEY
-            keyboard.add_hotkey(CURRENT_HOTKEY, launch_popup)
+            keyboard.add_hotkey(CURRENT_HOTKEY, toggle_popup)
+
+WORKSPACE_HOTKEYS = {}  # hotkey -> workspace name currently registered
+
+def update_workspace_hotkeys():
+    """Re-register the per-workspace hotkeys from config."""
+    wanted = {ws['hotkey']: name for name, ws in CATALOG.workspaces().items() if ws['hotkey']}
+    if wanted == WORKSPACE_HOTKEYS:
+        return
+    for hotkey in WORKSPACE_HOTKEYS:
+        try:
+            keyboard.remove_hotkey(hotkey)
+        except Exception:
+            pass
+    WORKSPACE_HOTKEYS.clear()
+    for hotkey, name in wanted.items():
+        try:
+            keyboard.add_hotkey(hotkey, run_workspace, args=(name,))
+            WORKSPACE_HOTKEYS[hotkey] = name
+        except Exception as e:
+            print(f"Could not register hotkey {hotkey} for workspace {name}: {e}")
 
 def start_hotkey_listener():
     """Initialize and register the hotkey from config."""
     initial_hotkey = get_configured_hotkey()
     update_hotkey(initial_hotkey)
+    update_workspace_hotkeys()
 
-# === Main ===
-root = tk.Tk()
+# === Instance Server ===
+INSTANCE_SERVER = None  # Started by main() once the hotkey and Tk are up
 
-# Set window icon BEFORE withdrawing
-try:
-    icon_path = resource_path(ICON_FILE)
-    if os.path.exists(icon_path):
-        root.iconbitmap(icon_path)
-    else:
-        # Try without path if file not found (for development)
+class InstanceServer:
+    """Loopback command server for later invocations (--launch/--show/--reload).
+
+    Listens on an ephemeral 127.0.0.1 port and publishes the port and a
+    random token in INSTANCE_FILE; requests without the token are refused.
+    Each request is one JSON line answered with one JSON line.
+    """
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.token = secrets.token_hex(16)
+        self.path = os.path.join(get_app_dir(), INSTANCE_FILE)
+        self.sock = None
+
+    def start(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        sock.listen(8)
+        self.sock = sock
+        info = {'port': sock.getsockname()[1], 'token': self.token, 'pid': os.getpid()}
+        write_file_atomic(self.path, json.dumps(info))
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        sock = self.sock  # stop() clears self.sock; closing it ends accept()
+        while True:
+            try:
+                conn, _ = sock.accept()
+            except OSError:
+                return  # Socket closed by stop()
+            with conn:
+                try:
+                    conn.settimeout(2.0)
+                    request = json.loads(conn.makefile('rb').readline(65536))
+                    token = str(request.get('token', '')).encode('utf-8')
+                    if not hmac.compare_digest(token, self.token.encode('utf-8')):
+                        reply = {'ok': False, 'error': INVALID_TOKEN_ERROR}
+                    else:
+                        reply = self.handler(request.get('command'), str(request.get('argument', '')))
+                except (OSError, ValueError, AttributeError) as e:
+                    reply = {'ok': False, 'error': f"Bad request: {e}"}
+                except Exception as e:
+                    # Never let one request end the accept loop
+                    print(f"Error handling instance request: {e}")
+                    reply = {'ok': False, 'error': f"Internal error: {e}"}
+                try:
+                    conn.sendall(json.dumps(reply).encode('utf-8') + b"\n")
+                except OSError:
+                    pass
+
+    def stop(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
         try:
-            root.iconbitmap(ICON_FILE)
-        except Exception:
+            # Only remove the file if a newer instance hasn't replaced it
+            with open(self.path, encoding='utf-8') as f:
+                ours = json.load(f).get('token') == self.token
+            if ours:
+                os.remove(self.path)
+        except (OSError, ValueError, AttributeError):
             pass
-except Exception:
-    pass
 
-root.withdraw()
+def find_tool_target(name):
+    """Return the target of the tool with this section name or label, or None."""
+    target = CATALOG.target_for(name)
+    if target:
+        return target
+    wanted = name.casefold()
+    for label, target, _, _ in CATALOG.tools():
+        if label.casefold() == wanted:
+            return target
+    return None
 
-if __name__ == "__main__":
-    # Ensure config file exists and create if necessary
-    ensure_config_exists()
-    # Load and set hotkey BEFORE creating tray icon
-    start_hotkey_listener()
-    create_tray_icon()
+def reload_config():
+    """Re-read every config layer and re-register hotkeys that changed."""
+    CATALOG.reload()
+    CATALOG.tools()
+    hotkey = get_configured_hotkey()
+    if hotkey != CURRENT_HOTKEY:
+        update_hotkey(hotkey)
+    update_workspace_hotkeys()
+
+def handle_instance_command(command, argument=""):
+    """Run a command sent by another invocation; returns the reply for it."""
+    if command == "ping":
+        pass  # Lets a caller check that this instance is alive
+    elif command == "show":
+        launch_popup()
+    elif command == "reload":
+        DISPATCHER.post("reload", reload_config, coalesce=True)
+    elif command == "launch":
+        target = find_tool_target(argument)
+        if target is None:
+            return {'ok': False, 'error': f"No tool named {argument!r}"}
+        launch_tool(target)
+    else:
+        return {'ok': False, 'error': f"Unknown command {command!r}"}
+    return {'ok': True}
+
+def start_instance_server():
+    """Publish this instance so later invocations forward to it instead of starting."""
+    global INSTANCE_SERVER
+    server = InstanceServer(handle_instance_command)
+    try:
+        server.start()
+    except OSError as e:
+        print(f"Could not start instance server: {e}")
+        return None
+    INSTANCE_SERVER = server
+    return server
+
+# === Startup ===
+STARTUP_PHASES = []  # (name, seconds) in completion order
+
+@contextmanager
+def startup_phase(name):
+    """Record how long a startup phase takes (shown by --profile-startup)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STARTUP_PHASES.append((name, time.perf_counter() - start))
+
+def print_startup_profile():
+    total = sum(seconds for _, seconds in STARTUP_PHASES)
+    print("ToolLauncher startup profile:")
+    for name, seconds in STARTUP_PHASES:
+        print(f"  {name:<10} {seconds * 1000:8.1f} ms")
+    print(f"  {'total':<10} {total * 1000:8.1f} ms")
+
+def init_root():
+    """Create the hidden Tk root window."""
+    global root
+    root = tk.Tk()
+
+    # Set window icon BEFORE withdrawing
+    try:
+        icon_path = resource_path(ICON_FILE)
+        if os.path.exists(icon_path):
+            root.iconbitmap(icon_path)
+        else:
+            # Try without path if file not found (for development)
+            try:
+                root.iconbitmap(ICON_FILE)
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    root.withdraw()
+    # Also runs anything the hotkey/tray posted while Tk was starting
+    DISPATCHER.start(root)
+
+# === Main ===
+root = None  # Created by init_root() once the hotkey is registered
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    profile = "--profile-startup" in argv
+    STARTUP_PHASES.append(("imports", time.perf_counter() - _IMPORT_START))
+
+    if "--import" in argv:
+        # Bulk import and exit, e.g. ToolLauncher.py --import bookmarks.html
+        index = argv.index("--import")
+        if index + 1 >= len(argv):
+            print("Usage: ToolLauncher.py --import <file.csv|file.json|bookmarks.html>")
+            return
+        ensure_config_exists()
+        start = time.perf_counter()
+        added, skipped = import_tools(argv[index + 1])
+        print(f"Imported {added} tools ({skipped} duplicates skipped) in {time.perf_counter() - start:.2f}s")
+        return
+
+    with startup_phase("config"):
+        # Ensure config file exists and create if necessary
+        ensure_config_exists()
+        CATALOG.tools()
+        RESOLVER.refresh()
+    # A profiling run must not take the hotkey or instance file from a running instance
+    running = profile and send_instance_command("ping") is not None
+    if running:
+        print("Another instance is running; profiling without registering the hotkey")
+    with startup_phase("hotkey"):
+        # Register the hotkey first so the launcher is usable as early as possible
+        if not running:
+            start_hotkey_listener()
+    with startup_phase("tk init"):
+        init_root()
+    if not profile:
+        with startup_phase("ipc"):
+            start_instance_server()
+    tray_ready = create_tray_icon()
+
+    # --launch/--show given but no instance was running: do it here
+    command = parse_instance_command(argv)
+    if command is not None and argv:
+        reply = handle_instance_command(*command)
+        if not reply['ok']:
+            print(reply['error'])
+
+    if profile:
+        tray_ready.wait(timeout=10)
+        print_startup_profile()
+        return
     root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+"""Headless performance benchmarks for ToolLauncher.
+
+Runs on Linux under a virtual X display (Xvfb is started automatically when
+DISPLAY is not set). The Windows/tray-only modules keyboard, pystray, PIL
+and winreg are replaced with stubs so ToolLauncher can be imported anywhere.
+
+For synthetic catalogs of 10/100/1k/10k tools it times load_tools() (cold
+and cached), a cold start from a fresh process-like catalog with and without
+the compiled snapshot, show_popup() (first build and warm show), hover handling,
+opening the settings dialog and save_config(), and records peak memory with
+tracemalloc. Results are written as JSON and compared with a stored baseline:
+
+    python benchmarks/bench_toollauncher.py                    # run and compare
+    python benchmarks/bench_toollauncher.py --save-baseline    # store new baseline
+    python benchmarks/bench_toollauncher.py --sizes 10 100 --output out.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+REGRESSION_RATIO = 1.25  # Slower than baseline by more than this is flagged
+
+
+# === Environment ===
+def install_stubs():
+    """Stand in for the modules that only work on a Windows desktop."""
+    keyboard = types.ModuleType("keyboard")
+    keyboard.add_hotkey = lambda *args, **kwargs: None
+    keyboard.remove_hotkey = lambda *args, **kwargs: None
+    sys.modules["keyboard"] = keyboard
+
+    pystray = types.ModuleType("pystray")
+    pystray.Icon = lambda *args, **kwargs: types.SimpleNamespace(run=lambda: None, stop=lambda: None)
+    pystray.Menu = lambda *args, **kwargs: None
+    pystray.MenuItem = lambda *args, **kwargs: None
+    sys.modules["pystray"] = pystray
+
+    pil = types.ModuleType("PIL")
+    pil.Image = types.SimpleNamespace(open=lambda path: None)
+    sys.modules["PIL"] = pil
+    sys.modules["PIL.Image"] = pil.Image
+
+    # No winreg: is_dark_mode() falls back to the light theme
+    sys.modules.pop("winreg", None)
+
+
+def start_virtual_display():
+    """Start Xvfb if there is no display. Returns the process, or None."""
+    if os.environ.get("DISPLAY") or sys.platform == "win32":
+        return None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None
+    display = ":97"
+    proc = subprocess.Popen([xvfb, display, "-screen", "0", "1920x1080x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ["DISPLAY"] = display
+    return proc
+
+
+def write_catalog(path, count):
+    """Write a synthetic ToolLauncher.conf with count tools across 8 categories."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write("[Settings]\nhotkey = ctrl+alt+f\n\n")
+        for i in range(count):
+            f.write(f"[Tool {i}]\n")
+            f.write(f"label = Tool number {i}\n")
+            if i % 3:
+                f.write(f"url = https://dashboard{i % 50}.example.com/view/{i}\n")
+            else:
+                f.write(f"path = tools\\\\app{i}.exe\n")
+            f.write(f"description = Synthetic entry {i} used for performance measurements\n")
+            f.write(f"category = Category {i % 8}\n\n")
+
+
+# === Measurement ===
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return {"min_ms": min(samples) * 1000,
+            "median_ms": statistics.median(samples) * 1000,
+            "repeat": repeat}
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_size(TL, count, gui):
+    """Run every benchmark against a catalog of count tools."""
+    write_catalog(TL.get_config_path(), count)
+    TL.CATALOG.invalidate()
+    repeat = 20 if count <= 1000 else 5
+    results = {}
+
+    def cold_load():
+        TL.CATALOG.invalidate()
+        TL.load_tools()
+
+    results["load_tools_cold"] = timed(cold_load, repeat)
+    results["load_tools_cached"] = timed(TL.load_tools, repeat * 10)
+
+    snapshot = os.path.join(os.path.dirname(TL.get_config_path()), TL.SNAPSHOT_FILE)
+
+    def cold_start_ini():
+        # Parse the INI and regenerate the snapshot, as after an edit
+        if os.path.exists(snapshot):
+            os.remove(snapshot)
+        TL.ToolCatalog().tools()
+
+    def cold_start_snapshot():
+        TL.ToolCatalog().tools()
+
+    results["cold_start_ini"] = timed(cold_start_ini, max(3, repeat // 2))
+    snapshot_result = timed(cold_start_snapshot, repeat)
+    snapshot_result["snapshot_bytes"] = os.path.getsize(snapshot)
+    results["cold_start_snapshot"] = snapshot_result
+
+    def save():
+        TL.save_config(TL.CATALOG.copy_config())
+
+    results["save_config"] = timed(save, max(3, repeat // 2))
+
+    if not gui:
+        results["peak_memory_bytes"] = peak_memory(cold_load)
+        return results
+
+    root = TL.root
+
+    def first_show():
+        if TL.POPUP is not None:
+            TL.POPUP.destroy()
+        TL.POPUP = None
+        TL.LAYOUT_CACHE.clear()
+        TL.show_popup()
+        root.update()
+
+    def warm_show():
+        TL.POPUP.hide()
+        TL.show_popup()
+        root.update()
+
+    results["show_popup_first"] = timed(first_show, max(3, repeat // 4))
+    results["show_popup_warm"] = timed(warm_show, repeat)
+
+    popup = TL.POPUP
+    if popup.virtual_mode:
+        view = popup.virtual
+        keys = list(view.drawn)
+        set_hover = view._set_hover
+    else:
+        keys = list(popup.tiles)
+        set_hover = popup._set_hover
+
+    def sweep():
+        # Move the hover across every tile once, like a fast mouse sweep
+        for key in keys:
+            set_hover(key)
+        set_hover(None)
+        root.update_idletasks()
+
+    sweep_result = timed(sweep, repeat)
+    sweep_result["tiles"] = len(keys)
+    sweep_result["per_tile_us"] = sweep_result["median_ms"] * 1000 / max(1, len(keys))
+    results["hover_sweep"] = sweep_result
+
+    def open_settings():
+        palette = TL.get_palette(False)
+        before = set(popup.window.winfo_children())
+        TL.show_settings_dialog(popup.window, False, palette['bg'], palette['fg'])
+        root.update()
+        for child in set(popup.window.winfo_children()) - before:
+            child.destroy()
+
+    results["settings_dialog_open"] = timed(open_settings, max(3, repeat // 2))
+    results["peak_memory_bytes"] = peak_memory(first_show)
+    return results
+
+
+# === Baseline comparison ===
+def compare(current, baseline):
+    """Return {size: {bench: ratio}} of current/baseline median times."""
+    report = {}
+    for size, benches in current["results"].items():
+        base = baseline.get("results", {}).get(size, {})
+        for name, value in benches.items():
+            if not isinstance(value, dict) or name not in base:
+                continue
+            ratio = value["median_ms"] / max(base[name]["median_ms"], 1e-6)
+            report.setdefault(size, {})[name] = round(ratio, 3)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--output", help="write results JSON here (default: stdout)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the new baseline")
+    parser.add_argument("--no-gui", action="store_true", help="skip the Tk benchmarks")
+    args = parser.parse_args(argv)
+
+    install_stubs()
+    xvfb = None if args.no_gui else start_virtual_display()
+    workdir = tempfile.mkdtemp(prefix="toollauncher-bench-")
+    os.environ["APPDATA"] = workdir
+    sys.path.insert(0, os.path.dirname(HERE))
+    try:
+        import ToolLauncher as TL
+
+        gui = False
+        if not args.no_gui:
+            try:
+                TL.init_root()
+                gui = True
+            except Exception as e:  # No display available
+                print(f"GUI benchmarks skipped: {e}", file=sys.stderr)
+
+        current = {
+            "meta": {"python": platform.python_version(), "platform": platform.platform(),
+                     "gui": gui, "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "results": {},
+        }
+        for size in args.sizes:
+            print(f"Benchmarking {size} tools...", file=sys.stderr)
+            current["results"][str(size)] = bench_size(TL, size, gui)
+
+        if os.path.exists(args.baseline) and not args.save_baseline:
+            with open(args.baseline) as f:
+                ratios = compare(current, json.load(f))
+            current["comparison"] = ratios
+            for size, benches in ratios.items():
+                for name, ratio in benches.items():
+                    if ratio > REGRESSION_RATIO:
+                        print(f"REGRESSION {size} tools {name}: {ratio:.2f}x baseline", file=sys.stderr)
+
+        text = json.dumps(current, indent=2)
+        if args.save_baseline:
+            with open(args.baseline, "w") as f:
+                f.write(text + "\n")
+        if args.output:
+            with open(args.output, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+        if xvfb is not None:
+            xvfb.terminate()
+
+
+if __name__ == "__main__":
+    main()